@@ -29,17 +29,17 @@ Usage:
     # Development
     python app.py
 
-    # Production
-    gunicorn 'app:create_app("production")'
+    # Production (gevent workers, see gunicorn.conf.py)
+    gunicorn -c gunicorn.conf.py 'app:create_app("production")'
 """
 
 import os
+import orjson
 from flask import Flask, jsonify, request, render_template_string
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from dotenv import load_dotenv
 from config import config
-from core.collector import system_monitor
-from core.preprocessor import data_scaler
 from core.crash_predictor import crash_predictor
 from core.process_monitor import process_monitor
 from core.crash_signatures import crash_sig_db
@@ -58,6 +58,44 @@ _GOOGLE_AUTH_HTML = GOOGLE_AUTH_HTML
 _PHONE_AUTH_HTML  = PHONE_AUTH_HTML
 _EMAIL_LINK_HTML  = EMAIL_LINK_AUTH_HTML
 
+# Accepted spellings of a true boolean query parameter
+_TRUTHY = frozenset(('true', 'True', 'TRUE', '1'))
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    Every ``jsonify`` call and ``request.get_json`` goes through this
+    provider, so the dashboard polling endpoints serialise in Rust instead
+    of the pure-Python stdlib encoder. NumPy scalars and arrays (returned
+    by the predictor and the scaler) are serialised natively.
+    """
+
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _options(self):
+        """Translate the provider's sort_keys / compact flags to orjson options."""
+        option = self.option
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if self.compact is False or (self.compact is None and self._app.debug):
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self._options()),
+            mimetype=self.mimetype,
+        )
+
 
 def create_app(config_name=None):
     """
@@ -77,12 +115,21 @@ def create_app(config_name=None):
 
     app = Flask(__name__)
     app.config.from_object(config[config_name])
+    app.json = ORJSONProvider(app)
+    # Flask >= 2.3 reads these from the provider rather than app.config
+    app.json.sort_keys = app.config['JSON_SORT_KEYS']
+    app.json.compact = not app.config['JSONIFY_PRETTYPRINT_REGULAR']
 
     # Enable CORS so the frontend (or desktop app) can call the API
     CORS(app)
 
     # Start the background metrics collection thread.
     # Polls CPU, memory, disk I/O, and network I/O every 0.5 seconds.
+    # Started here, inside the serving process (after gunicorn forks and
+    # gevent patches), and exposed as app.system_monitor. This is the shared
+    # singleton because the crash predictor reads the same history.
+    from core.collector import system_monitor
+    app.system_monitor = system_monitor
     system_monitor.start()
 
     # Start the per-process crash detection monitor.
@@ -249,13 +296,27 @@ def create_app(config_name=None):
     # ── Route: Current Metrics ──────────────────────────────────
     @app.route('/api/metrics/current', methods=['GET'])
     def get_current_metrics():
-        metrics = system_monitor.get_latest_metrics()
-        if not metrics:
-            return jsonify({})
-        normalized = request.args.get('normalized', 'false').lower() == 'true'
+        """
+        Serve the latest snapshot from the monitor's pre-serialised JSON.
+
+        Responses carry an ETag derived from the snapshot timestamp; clients
+        polling faster than the collector get 304 Not Modified with no body
+        until a new snapshot is published.
+        """
+        normalized = request.args.get('normalized') in _TRUTHY
+        etag, body = system_monitor.get_latest_payload(normalized)
+        if etag is None:
+            return app.response_class(body, mimetype='application/json')
         if normalized:
-            return jsonify(data_scaler.normalize_metrics(metrics))
-        return jsonify(metrics)
+            etag += '-n'
+
+        if request.if_none_match.contains(etag):
+            resp = app.response_class(status=304)
+        else:
+            resp = app.response_class(body, mimetype='application/json')
+        resp.set_etag(etag)
+        resp.headers['Cache-Control'] = 'no-cache'
+        return resp
 
     # ── Route: Crash Prediction ─────────────────────────────────
     @app.route('/api/prediction', methods=['GET'])
@@ -564,5 +625,5 @@ if __name__ == '__main__':
         app.run(host='0.0.0.0', port=5000)
     finally:
         # Ensure the metrics polling thread is cleanly stopped on shutdown
-        system_monitor.stop()
+        app.system_monitor.stop()
         process_monitor.stop()
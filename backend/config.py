@@ -32,10 +32,16 @@ class Config:
                     In production, this MUST be set via the SECRET_KEY env var.
         DEBUG:      Disabled by default; overridden in subclasses.
         TESTING:    Disabled by default; enable for test suites.
+        JSON_SORT_KEYS:              Key sorting disabled — responses are
+                                     polled continuously and order is irrelevant.
+        JSONIFY_PRETTYPRINT_REGULAR: Compact JSON in every environment,
+                                     including DEBUG.
     """
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'hard-to-guess-string-for-dev'
     DEBUG = False
     TESTING = False
+    JSON_SORT_KEYS = False
+    JSONIFY_PRETTYPRINT_REGULAR = False
 
 
 class DevelopmentConfig(Config):
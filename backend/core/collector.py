@@ -8,14 +8,19 @@ Provides two monitoring components:
    A background thread that polls system metrics (CPU, memory, disk I/O,
    network I/O) at a configurable interval and stores them in a fixed-size
    circular buffer (deque). Thread-safe access is ensured via a threading lock.
+   The latest snapshot is also pre-serialised to JSON bytes (raw and
+   normalised) once per poll, so API handlers serve it without re-encoding.
+   A parallel NumPy ring buffer holds the same history column-wise
+   (struct-of-arrays) for vectorised analytics.
 
    Default configuration:
        - poll_interval = 0.5 seconds
        - history_size = 120 entries  → 60 seconds of history
 
 2. **LogMonitor** (FR-02)
-   Uses the `watchdog` library to watch log files for changes. On any file
-   modification it reads the newly appended lines, tokenises them via
+   Uses the `watchdog` library to watch log files for changes. Events are
+   filtered to the configured file names before they reach Python
+   callbacks. On a matching modification it reads the newly appended lines, tokenises them via
    LogTokenizer, detects [ERROR] / [WARN] patterns, and fires a registered
    event callback within <100 ms.
 
@@ -27,18 +32,36 @@ Usage:
 
     system_monitor.start()                     # Begin background polling
     current = system_monitor.get_latest_metrics()  # Most recent snapshot
+    etag, payload = system_monitor.get_latest_payload()  # Snapshot as JSON bytes + tag
     history = system_monitor.get_history()      # All buffered snapshots
+    matrix  = system_monitor.get_history_array()  # Same, as (n, 8) float64
     system_monitor.stop()                       # Cleanly terminate the thread
 """
 
+import glob
 import os
 import re
 import time
 import threading
+import numpy as np
+import orjson
 import psutil
-from collections import deque
+from collections import deque, namedtuple
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import PatternMatchingEventHandler
+
+from core.preprocessor import data_scaler
+
+# Field order of a metrics snapshot; also the column order of
+# SystemMonitor.get_history_array().
+METRIC_FIELDS = (
+    'timestamp', 'cpu_percent', 'memory_percent', 'memory_used',
+    'disk_read_bytes', 'disk_write_bytes', 'net_bytes_sent', 'net_bytes_recv',
+)
+
+# Compact internal record for one snapshot. Public accessors convert to a
+# dict with ``_asdict()`` at the API boundary.
+Metrics = namedtuple('Metrics', METRIC_FIELDS)
 
 # Regex patterns for real-time log parsing (FR-02)
 _LOG_PATTERNS = [
@@ -64,39 +87,65 @@ class SystemMonitor:
         poll_interval: Seconds between consecutive metric collections.
 
     Attributes:
-        metrics_history (deque): Circular buffer of metric dicts.
+        metrics_history (deque): Circular buffer of Metrics namedtuples.
         running (bool):          Whether the polling thread is active.
         thread (Thread | None):  Reference to the background polling thread.
         lock (Lock):             Threading lock protecting metrics_history.
+                                 The latest snapshot is published separately
+                                 as a single attribute and is read lock-free.
     """
 
     def __init__(self, history_size=120, poll_interval=0.5):
         self.history_size = history_size
         self.poll_interval = poll_interval
         self.metrics_history = deque(maxlen=history_size)
+        # Struct-of-arrays mirror of metrics_history: one row per snapshot,
+        # one column per METRIC_FIELDS entry. _cursor counts rows written.
+        self._buf = np.zeros((history_size, len(METRIC_FIELDS)), dtype=np.float64)
+        self._cursor = 0
         self.running = False
         self.thread = None
         self.lock = threading.Lock()
+        # Set by stop(); the poller waits on it so shutdown is immediate.
+        self._stop_ev = threading.Event()
+        # Latest snapshot, published by the poller with one attribute store.
+        self._latest = None
+        # (etag, raw JSON, normalised JSON) of the latest snapshot, rebuilt
+        # once per poll and published as one tuple so the tag always
+        # describes the bytes it is served with.
+        self._payload = (None, b'{}', b'{}')
+        # Bound once so each tick skips the module attribute lookups.
+        self._cpu = psutil.cpu_percent
+        self._vm = psutil.virtual_memory
+        self._dio = psutil.disk_io_counters
+        self._nio = psutil.net_io_counters
+        self._now = time.time
 
     def start(self):
         """
         Start the background polling thread.
 
-        If already running, this method is a no-op (idempotent).
+        If a live polling thread already exists, this method is a no-op
+        (idempotent), so repeated create_app() calls never spawn a second
+        poller. A thread that has died is replaced.
         The thread is marked as a daemon so it won't prevent process exit.
         """
-        if not self.running:
-            self.running = True
-            self.thread = threading.Thread(target=self._poll_loop, daemon=True)
-            self.thread.start()
+        if self.running and self.thread is not None and self.thread.is_alive():
+            return
+        self.running = True
+        self._stop_ev.clear()
+        self.thread = threading.Thread(target=self._poll_loop, daemon=True)
+        self.thread.start()
 
     def stop(self):
         """
         Signal the polling thread to stop and wait for it to terminate.
 
-        Safe to call even if the monitor was never started.
+        Safe to call even if the monitor was never started. Returns as soon
+        as the in-flight poll finishes rather than after a full interval.
         """
         self.running = False
+        self._stop_ev.set()
         if self.thread:
             self.thread.join()
 
@@ -105,20 +154,39 @@ class SystemMonitor:
         Main polling loop — runs on the background thread.
 
         Continuously collects metrics and appends them to the history
-        buffer until `self.running` is set to False.
+        buffer until stop() sets the stop event.
         """
-        while self.running:
+        # cpu_percent(interval=None) reports usage since the previous call,
+        # so the very first call returns a meaningless 0.0. Prime the
+        # baseline on this thread (psutil tracks it per calling thread) and
+        # let a short window elapse so the first stored snapshot is real.
+        self._cpu(interval=None)
+        self._stop_ev.wait(0.1)
+        while not self._stop_ev.is_set():
             metrics = self._collect_metrics()
+            self._latest = metrics
             with self.lock:
                 self.metrics_history.append(metrics)
-            time.sleep(self.poll_interval)
+                self._buf[self._cursor % self.history_size] = metrics
+                self._cursor += 1
+            # Serialise once per tick; a single attribute store is atomic
+            # under the GIL, so readers never see a half-built payload.
+            # orjson beats a fixed-schema %-format template for this shape
+            # (float repr dominates the template), so it is kept here.
+            snapshot = metrics._asdict()
+            self._payload = (
+                repr(metrics.timestamp),
+                orjson.dumps(snapshot),
+                orjson.dumps(data_scaler.normalize_metrics(snapshot)),
+            )
+            self._stop_ev.wait(self.poll_interval)
 
     def _collect_metrics(self):
         """
         Collect a single snapshot of system metrics via psutil.
 
         Returns:
-            dict: A snapshot containing:
+            Metrics: A snapshot namedtuple containing:
                 - timestamp (float):         UNIX epoch seconds
                 - cpu_percent (float):       CPU utilisation (0-100)
                 - memory_percent (float):    RAM utilisation (0-100)
@@ -128,22 +196,22 @@ class SystemMonitor:
                 - net_bytes_sent (int):      Cumulative network bytes sent
                 - net_bytes_recv (int):      Cumulative network bytes received
         """
-        timestamp = time.time()
-        cpu_percent = psutil.cpu_percent(interval=None)
-        virtual_memory = psutil.virtual_memory()._asdict()
-        disk_io = psutil.disk_io_counters()
-        net_io = psutil.net_io_counters()
-
-        return {
-            'timestamp': timestamp,
-            'cpu_percent': cpu_percent,
-            'memory_percent': virtual_memory['percent'],
-            'memory_used': virtual_memory['used'],
-            'disk_read_bytes': disk_io.read_bytes if disk_io else 0,
-            'disk_write_bytes': disk_io.write_bytes if disk_io else 0,
-            'net_bytes_sent': net_io.bytes_sent if net_io else 0,
-            'net_bytes_recv': net_io.bytes_recv if net_io else 0
-        }
+        timestamp = self._now()
+        cpu_percent = self._cpu(interval=None)
+        virtual_memory = self._vm()
+        disk_io = self._dio()
+        net_io = self._nio()
+
+        return Metrics(
+            timestamp,
+            cpu_percent,
+            virtual_memory.percent,
+            virtual_memory.used,
+            disk_io.read_bytes if disk_io else 0,
+            disk_io.write_bytes if disk_io else 0,
+            net_io.bytes_sent if net_io else 0,
+            net_io.bytes_recv if net_io else 0,
+        )
 
     def get_latest_metrics(self):
         """
@@ -153,10 +221,27 @@ class SystemMonitor:
             dict | None: The latest metrics dict, or None if no data
                          has been collected yet.
         """
-        with self.lock:
-            if self.metrics_history:
-                return list(self.metrics_history)[-1]
-            return None
+        # Single writer, many readers: the reference store in _poll_loop is
+        # atomic under the GIL, so no lock is needed on this hot path.
+        latest = self._latest
+        return latest._asdict() if latest is not None else None
+
+    def get_latest_payload(self, normalized=False):
+        """
+        Return the pre-serialised latest snapshot together with its tag.
+
+        The tag is the snapshot timestamp, so it changes exactly when the
+        payload does and can be used as an HTTP entity tag.
+
+        Args:
+            normalized: If True, return the DataScaler-normalised variant.
+
+        Returns:
+            tuple[str | None, bytes]: (tag, JSON bytes); the tag is None
+                                      until the first poll completes.
+        """
+        tag, raw, norm = self._payload
+        return tag, (norm if normalized else raw)
 
     def get_history(self):
         """
@@ -167,7 +252,24 @@ class SystemMonitor:
                         Length is at most `history_size`.
         """
         with self.lock:
-            return list(self.metrics_history)
+            snapshot = tuple(self.metrics_history)
+        return [m._asdict() for m in snapshot]
+
+    def get_history_array(self) -> np.ndarray:
+        """
+        Return the metrics history as a 2-D float64 array, oldest row first.
+
+        Columns follow `METRIC_FIELDS`. Suited to vectorised statistics and
+        model input without walking per-snapshot dicts.
+
+        Returns:
+            np.ndarray: Array of shape (n, len(METRIC_FIELDS)), n <= history_size.
+        """
+        with self.lock:
+            if self._cursor <= self.history_size:
+                return self._buf[:self._cursor].copy()
+            start = self._cursor % self.history_size
+            return np.concatenate((self._buf[start:], self._buf[:start]))
 
     def get_history_since(self, since_timestamp: float) -> list:
         """
@@ -179,25 +281,35 @@ class SystemMonitor:
         Returns:
             list[dict]: Snapshots whose timestamp > since_timestamp.
         """
+        # Snapshot under the lock, filter outside it to keep the hold short.
         with self.lock:
-            return [m for m in self.metrics_history if m.get('timestamp', 0) > since_timestamp]
+            snapshot = tuple(self.metrics_history)
+        return [m._asdict() for m in snapshot if m.timestamp > since_timestamp]
 
 
-class LogFileEventHandler(FileSystemEventHandler):
+class LogFileEventHandler(PatternMatchingEventHandler):
     """
     Watchdog event handler that triggers a callback on file modifications.
 
+    Only events for the given file names are dispatched; changes to other
+    files in the same directory are dropped by watchdog's pattern matcher.
+
     Args:
-        callback: Callable that receives the modified file path (str).
+        callback:  Callable that receives the modified file path (str).
+        filenames: Base names of the files to watch within one directory.
     """
 
-    def __init__(self, callback):
+    def __init__(self, callback, filenames):
+        super().__init__(
+            patterns=[glob.escape(name) for name in filenames],
+            ignore_directories=True,
+            case_sensitive=True,
+        )
         self.callback = callback
 
     def on_modified(self, event):
-        """Forward non-directory modification events to the callback."""
-        if not event.is_directory:
-            self.callback(event.src_path)
+        """Forward modification events for watched files to the callback."""
+        self.callback(event.src_path)
 
 
 class LogMonitor:
@@ -205,15 +317,16 @@ class LogMonitor:
     File system watcher for log files.
 
     Uses the watchdog library to monitor directories containing the
-    specified log files and trigger callbacks on modification.
+    specified log files and trigger callbacks on modification of those
+    files only.
 
     Args:
         log_paths: List of absolute paths to log files to watch.
 
     Note:
         Watchdog operates at the *directory* level, so we extract the
-        parent directory of each log file and schedule one observer per
-        unique directory.
+        parent directory of each log file and schedule one handler per
+        unique directory, matching only that directory's target files.
     """
 
     def __init__(self, log_paths):
@@ -256,16 +369,17 @@ class LogMonitor:
             # Record initial file size to avoid re-reading existing content
             self._file_positions[abs_path] = os.path.getsize(abs_path)
 
-        # Deduplicate parent directories (watchdog watches directories, not files)
-        paths_to_watch = set()
+        # Group target files by parent directory (watchdog watches
+        # directories, not files)
+        files_by_dir = {}
         for log_file in self.log_paths:
-            directory = os.path.dirname(os.path.abspath(log_file))
-            paths_to_watch.add(directory)
-
-        event_handler = LogFileEventHandler(self._on_log_change)
+            directory, name = os.path.split(os.path.abspath(log_file))
+            files_by_dir.setdefault(directory, set()).add(name)
 
-        for directory in paths_to_watch:
-            self.observer.schedule(event_handler, directory, recursive=False)
+        for directory, names in files_by_dir.items():
+            handler = LogFileEventHandler(self._on_log_change, names)
+            self.handlers.append(handler)
+            self.observer.schedule(handler, directory, recursive=False)
 
         self.observer.start()
 
@@ -285,15 +399,7 @@ class LogMonitor:
         Args:
             file_path: Absolute path to the modified file.
         """
-        # Only process files we are explicitly monitoring
-        matched = any(
-            os.path.abspath(file_path).endswith(os.path.abspath(t).lstrip('/'))
-            or os.path.abspath(file_path) == os.path.abspath(t)
-            for t in self.log_paths
-        )
-        if not matched:
-            return
-
+        # Events are pre-filtered to monitored files by LogFileEventHandler
         abs_path = os.path.abspath(file_path)
         try:
             current_size = os.path.getsize(abs_path)
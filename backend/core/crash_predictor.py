@@ -56,7 +56,6 @@ except ImportError:
     _SHAP_AVAILABLE = False
     print("[CrashPredictor] shap not installed — FR-04 SHAP attribution disabled.")
 
-from core.collector import system_monitor
 from core.preprocessor import data_scaler
 from core.resolution import system_resolver
 
@@ -446,10 +445,7 @@ class HybridCrashPredictor:
         if len(history) < self.window_size:
             return np.array([])
 
-        normalized = [data_scaler.normalize_metrics(m) for m in history]
-        arrays = {}
-        for key in _METRIC_KEYS:
-            arrays[key] = np.array([m.get(key, 0.0) for m in normalized])
+        arrays = data_scaler.normalize_batch(history)
 
         n_windows = len(history) - self.window_size + 1
         features_list = []
@@ -524,13 +520,13 @@ class HybridCrashPredictor:
         if len(history) < 4:
             return []
 
-        normalized = [data_scaler.normalize_metrics(m) for m in history]
-        recent = normalized[-min(self.window_size, len(normalized)):]
+        arrays = data_scaler.normalize_batch(history)
+        n_recent = min(self.window_size, len(history))
         factors = []
 
         for key in _METRIC_KEYS:
-            baseline_vals = [m.get(key, 0) for m in normalized]
-            recent_vals = [m.get(key, 0) for m in recent]
+            baseline_vals = arrays[key]
+            recent_vals = baseline_vals[-n_recent:]
             baseline_mean = np.mean(baseline_vals)
             baseline_std = np.std(baseline_vals) + 1e-8
             recent_mean = np.mean(recent_vals)
@@ -545,8 +541,10 @@ class HybridCrashPredictor:
                 })
 
         # Cross-metric checks
-        cpu_recent = np.mean([m.get("cpu_percent", 0) for m in recent])
-        mem_recent = np.mean([m.get("memory_percent", 0) for m in recent])
+        cpu_v = arrays["cpu_percent"][-n_recent:]
+        mem_v = arrays["memory_percent"][-n_recent:]
+        cpu_recent = np.mean(cpu_v)
+        mem_recent = np.mean(mem_v)
 
         if cpu_recent > 0.6 and mem_recent > 0.6:
             factors.append({
@@ -557,10 +555,8 @@ class HybridCrashPredictor:
             })
 
         # Rate of change
-        if len(recent) >= 4:
-            half = len(recent) // 2
-            cpu_v = [m.get("cpu_percent", 0) for m in recent]
-            mem_v = [m.get("memory_percent", 0) for m in recent]
+        if n_recent >= 4:
+            half = n_recent // 2
             cpu_roc = abs(np.mean(cpu_v[half:]) - np.mean(cpu_v[:half]))
             mem_roc = abs(np.mean(mem_v[half:]) - np.mean(mem_v[:half]))
 
@@ -631,6 +627,10 @@ class HybridCrashPredictor:
                 "data_points": 0,
             }
 
+        # Imported here, not at module level: importing core.collector builds
+        # the SystemMonitor singleton, which should only happen in the serving
+        # process (create_app), not whenever this module is imported.
+        from core.collector import system_monitor
         history = system_monitor.get_history()
 
         if len(history) < 10:
@@ -8,7 +8,9 @@ Provides two preprocessing utilities for the crash prediction pipeline:
    Normalises raw system metrics into a 0-1 range suitable for ML models.
    - Percentage metrics (CPU, memory) → simple linear scaling ÷ 100.
    - Byte counters (disk I/O, network I/O) → logarithmic scaling via
-     `np.log1p()` to handle the wide dynamic range of byte values.
+     `math.log1p()` to handle the wide dynamic range of byte values.
+   - Large batches use `numexpr` for the log when it is installed
+     (optional; NumPy otherwise).
 
 2. **LogTokenizer**
    Converts raw log lines into integer token sequences for NLP-based
@@ -16,6 +18,10 @@ Provides two preprocessing utilities for the crash prediction pipeline:
    - Builds a vocabulary on-the-fly up to `vocab_size` tokens.
    - Uses <PAD> (0) and <UNK> (1) as special tokens.
    - Words not in the vocabulary default to <UNK>.
+   - Encodings of recently seen lines are memoised (LRU).
+   - `freeze()` stops vocabulary growth; `tokenize_batch()` encodes many
+     lines into a padded NumPy matrix; `bow_counts()` into a sparse
+     bag-of-words count matrix.
 
 Module-Level Singletons:
     `data_scaler`    — Pre-created DataScaler instance.
@@ -25,11 +31,47 @@ Usage:
     from core.preprocessor import data_scaler, log_tokenizer
 
     normalised = data_scaler.normalize_metrics(raw_metrics)
+    columns    = data_scaler.normalize_batch(history)   # {field: ndarray}
+    vector     = data_scaler.normalize_vector(raw_metrics)  # ndarray (6,)
     token_ids  = log_tokenizer.tokenize_log("ERROR: connection refused")
+    batch      = log_tokenizer.tokenize_batch(lines)   # (len(lines), width) int32
 """
 
+import sys
+from functools import lru_cache
+from itertools import chain, repeat
+from math import log1p
+
 import numpy as np
 
+try:
+    import numexpr as _ne
+    _NUMEXPR_AVAILABLE = True
+except ImportError:
+    _NUMEXPR_AVAILABLE = False
+
+# Below this many elements numexpr's compile/dispatch cost outweighs its
+# multi-threaded, vector-math kernels, so small batches stay on NumPy.
+_NUMEXPR_MIN_SIZE = 1 << 14
+
+# Field groups handled by DataScaler, in the column order of normalize_batch.
+_PERCENT_KEYS = ('cpu_percent', 'memory_percent')
+_BYTE_KEYS = ('disk_read_bytes', 'disk_write_bytes',
+              'net_bytes_recv', 'net_bytes_sent')
+_KEYS = _PERCENT_KEYS + _BYTE_KEYS
+_N_PCT = len(_PERCENT_KEYS)
+
+# Dequantisation constant for `DataScaler.quantize_unit`: value = q * UNIT_SCALE.
+UNIT_SCALE = 1.0 / 65535
+
+
+def _log1p_inplace(a):
+    """log1p over a contiguous float array, in place (numexpr when worthwhile)."""
+    if _NUMEXPR_AVAILABLE and a.size >= _NUMEXPR_MIN_SIZE:
+        _ne.evaluate('log1p(a)', local_dict={'a': a}, out=a, casting='same_kind')
+    else:
+        np.log1p(a, out=a)
+
 
 class DataScaler:
     """
@@ -37,29 +79,36 @@ class DataScaler:
 
     Strategy:
         - Percentage fields (0-100 range)  → divide by 100
-        - Byte magnitude fields            → np.log1p() for logarithmic compression
+        - Byte magnitude fields            → log1p() for logarithmic compression
         - Timestamp                        → passed through unchanged
 
+    Args:
+        ring_size: Rows kept by the streaming ring buffer (see `push`).
+
     Attributes:
         ranges (dict): Reference ranges for linear normalisation.
                        Currently only used for documentation; the actual
                        scaling is hardcoded for performance.
     """
 
-    def __init__(self):
+    def __init__(self, ring_size=120):
         # Reference ranges for percentage-based metrics (informational).
         # Byte-based metrics use log scaling instead of min-max.
         self.ranges = {
             'cpu_percent': (0, 100),
             'memory_percent': (0, 100),
         }
+        # Streaming ring of normalised rows (columns follow _KEYS); _head
+        # counts rows pushed, so the next slot is _head % ring_size.
+        self._ring = np.zeros((ring_size, len(_KEYS)), dtype=np.float32)
+        self._head = 0
 
     def normalize_metrics(self, metrics):
         """
         Normalise a metrics dictionary.
 
         Args:
-            metrics: Raw metrics dict from SystemMonitor._collect_metrics().
+            metrics: Raw metrics dict from SystemMonitor.get_latest_metrics().
                      Expected keys: cpu_percent, memory_percent,
                      disk_read_bytes, disk_write_bytes, net_bytes_recv,
                      net_bytes_sent, timestamp.
@@ -73,24 +122,148 @@ class DataScaler:
         if not metrics:
             return {}
 
-        normalized = {}
+        return {
+            # ── Linear scaling for percentage metrics (0–100 → 0–1) ──
+            'cpu_percent': metrics.get('cpu_percent', 0) / 100.0,
+            'memory_percent': metrics.get('memory_percent', 0) / 100.0,
+            # ── Logarithmic scaling for byte counters ────────────
+            # log1p(x) = ln(1 + x) — handles zero gracefully and compresses
+            # large byte values into a manageable range for ML models.
+            # math.log1p on scalars avoids NumPy's 0-d array dispatch and
+            # returns plain Python floats. `or 0` maps a null counter (absent
+            # disk/net stats serialised as None) to zero instead of raising.
+            'disk_read_bytes': log1p(metrics.get('disk_read_bytes') or 0),
+            'disk_write_bytes': log1p(metrics.get('disk_write_bytes') or 0),
+            'net_bytes_recv': log1p(metrics.get('net_bytes_recv') or 0),
+            'net_bytes_sent': log1p(metrics.get('net_bytes_sent') or 0),
+            # ── Pass-through fields ──────────────────────────────
+            'timestamp': metrics.get('timestamp'),
+        }
 
-        # ── Linear scaling for percentage metrics (0–100 → 0–1) ──
-        normalized['cpu_percent'] = metrics.get('cpu_percent', 0) / 100.0
-        normalized['memory_percent'] = metrics.get('memory_percent', 0) / 100.0
+    def push(self, metrics):
+        """
+        Normalise one snapshot into the next slot of the ring buffer.
 
-        # ── Logarithmic scaling for byte counters ────────────────
-        # log1p(x) = ln(1 + x) — handles zero gracefully and compresses
-        # large byte values into a manageable range for ML models.
-        normalized['disk_read_bytes'] = np.log1p(metrics.get('disk_read_bytes', 0))
-        normalized['disk_write_bytes'] = np.log1p(metrics.get('disk_write_bytes', 0))
-        normalized['net_bytes_recv'] = np.log1p(metrics.get('net_bytes_recv', 0))
-        normalized['net_bytes_sent'] = np.log1p(metrics.get('net_bytes_sent', 0))
+        Steady-state streaming path: the raw values are written into a
+        preallocated float32 row and scaled there in place, so no result
+        dict or output array is allocated per tick.
 
-        # ── Pass-through fields ──────────────────────────────────
-        normalized['timestamp'] = metrics.get('timestamp')
+        Args:
+            metrics: Raw metrics dict (see `normalize_metrics`).
 
-        return normalized
+        Returns:
+            np.ndarray: View of the row just written (shape (6,)); it is
+                        overwritten once the ring wraps.
+        """
+        row = self._ring[self._head % len(self._ring)]
+        # Element-wise stores straight into the preallocated row (no list).
+        for i, k in enumerate(_KEYS):
+            row[i] = metrics.get(k) or 0
+        np.divide(row[:_N_PCT], 100.0, out=row[:_N_PCT])
+        np.log1p(row[_N_PCT:], out=row[_N_PCT:])
+        self._head += 1
+        return row
+
+    def get_ring_array(self):
+        """
+        Return the pushed rows as a float32 array, oldest row first.
+
+        Returns:
+            np.ndarray: Copy of shape (n, 6), n <= ring_size; columns follow
+                        `_KEYS`.
+        """
+        size = len(self._ring)
+        if self._head <= size:
+            return self._ring[:self._head].copy()
+        start = self._head % size
+        return np.concatenate((self._ring[start:], self._ring[:start]))
+
+    def normalize_batch(self, metrics_list, dtype=np.float64):
+        """
+        Normalise a sequence of metrics dictionaries in one pass.
+
+        Same scaling as `normalize_metrics`, but the values are gathered
+        into a single float64 block so `np.log1p` and the percentage
+        division run once over the whole batch instead of per sample.
+
+        Args:
+            metrics_list: Sequence of raw metrics dicts (e.g. the output of
+                          SystemMonitor.get_history()).
+            dtype:        Output float dtype. float32 halves the memory
+                          traffic for model input; the scaled values are
+                          small enough that the precision loss is negligible.
+
+        Returns:
+            dict: Field name → 1-D `dtype` array of length len(metrics_list),
+                  one entry per percentage and byte field. Timestamps are
+                  not included.
+        """
+        n = len(metrics_list)
+        # Field-major order so each field's samples form a contiguous row.
+        block = np.fromiter(
+            (m.get(k) or 0 for k in _KEYS for m in metrics_list),
+            dtype=dtype, count=len(_KEYS) * n,
+        ).reshape(len(_KEYS), n)
+
+        block[:_N_PCT] /= 100.0
+        _log1p_inplace(block[_N_PCT:])
+        return dict(zip(_KEYS, block))
+
+    def normalize_vector(self, metrics, dtype=np.float64):
+        """
+        Normalise one metrics dictionary into a fixed-layout vector.
+
+        For callers that feed models or replay buffers and have no use for
+        the dict form. Scaling is done in place on a single array: one
+        multiply for the percentage fields, one `np.log1p` for the rest.
+
+        Args:
+            metrics: Raw metrics dict (see `normalize_metrics`).
+            dtype:   Output float dtype (see `normalize_batch`).
+
+        Returns:
+            np.ndarray: `dtype` array of shape (6,), ordered as the module's
+                        `_KEYS` (cpu, memory, disk read/write, net recv/sent).
+        """
+        v = np.fromiter((metrics.get(k) or 0 for k in _KEYS),
+                        dtype=dtype, count=len(_KEYS))
+        v[:_N_PCT] /= 100.0
+        np.log1p(v[_N_PCT:], out=v[_N_PCT:])
+        return v
+
+    @staticmethod
+    def quantize_unit(values):
+        """
+        Quantise [0, 1] values (the scaled percentage fields) to uint16.
+
+        Values are clipped to [0, 1] first. Dequantise with
+        ``q * UNIT_SCALE``; the round-trip error is at most UNIT_SCALE / 2.
+
+        Args:
+            values: Array-like of unit-range floats.
+
+        Returns:
+            np.ndarray: uint16 array of the same shape (a uint16 scalar for
+                        scalar input).
+        """
+        # Not rint(out=q): for scalar input q is a NumPy scalar, not an array.
+        return np.rint(np.clip(values, 0.0, 1.0) * 65535).astype(np.uint16)
+
+    @staticmethod
+    def as_dict(vector, timestamp=None):
+        """
+        Wrap a `normalize_vector` result in the `normalize_metrics` dict shape.
+
+        Args:
+            vector:    Array from `normalize_vector`.
+            timestamp: Value for the pass-through 'timestamp' key.
+
+        Returns:
+            dict: Field name → Python float, plus 'timestamp'.
+        """
+        out = dict(zip(_KEYS, vector.tolist()))
+        out['timestamp'] = timestamp
+        return out
 
 
 class LogTokenizer:
@@ -99,24 +272,88 @@ class LogTokenizer:
 
     Splits log lines on whitespace and maps each token to a unique integer ID.
     The vocabulary grows dynamically until `vocab_size` is reached; any
-    subsequent unseen tokens are mapped to <UNK>.
+    subsequent unseen tokens are mapped to <UNK>. Reaching `vocab_size`
+    freezes the tokenizer automatically.
 
     Special Tokens:
         - <PAD> = 0  — used for sequence padding in batch processing
         - <UNK> = 1  — used for out-of-vocabulary tokens
 
     Args:
-        vocab_size: Maximum number of unique tokens to track (default: 1000).
+        vocab_size:      Maximum number of unique tokens to track (default: 1000).
+        line_cache_size: Number of distinct lines whose encodings are
+                         memoised (default: 4096).
 
     Attributes:
         token_map (dict):    Token string → integer ID mapping.
         next_token_id (int): Next available integer ID for new tokens.
+        frozen (bool):       True once `freeze()` has been called.
     """
 
-    def __init__(self, vocab_size=1000):
+    def __init__(self, vocab_size=1000, line_cache_size=4096):
         self.vocab_size = vocab_size
+        self.line_cache_size = line_cache_size
         self.token_map = {'<PAD>': 0, '<UNK>': 1}
         self.next_token_id = 2  # IDs 0 and 1 are reserved
+        self.frozen = False
+        # Whole-line memo: log lines repeat verbatim (same error every poll),
+        # and a line's ids never change once computed — assigned ids are
+        # permanent and <UNK> only occurs once the vocabulary is full.
+        self._encode_cached = lru_cache(maxsize=line_cache_size)(self._encode)
+
+    def freeze(self):
+        """
+        Stop growing the vocabulary.
+
+        After freezing, encoding becomes a pure lookup: unseen tokens map to
+        <UNK> and the mapping runs entirely inside ``map(dict.get)`` with no
+        per-token Python bytecode.
+        """
+        self.frozen = True
+        self._encode_cached = lru_cache(maxsize=self.line_cache_size)(
+            self._encode_frozen
+        )
+
+    def _encode_frozen(self, log_line):
+        """`_encode` variant bound by `freeze()` — lookup only."""
+        return tuple(map(self.token_map.get, log_line.split(), repeat(1)))
+
+    def _encode(self, log_line):
+        """Encode one line to a tuple of ids, growing the vocabulary."""
+        # Hot loop: bind attributes to locals and do one dict lookup per token.
+        # A C-level ``tuple(map(lookup, tokens))`` pre-pass measures at parity
+        # with this loop on all-known lines, so the loop is kept as the single
+        # path; repeated lines are served by the LRU memo instead. Likewise,
+        # pre-sizing the output ([1] * n with indexed writes, or overwriting
+        # the split list in place) is no faster than a bound append here.
+        token_map = self.token_map
+        lookup = token_map.get
+        intern = sys.intern
+        next_id = self.next_token_id
+        vocab_size = self.vocab_size
+        token_ids = []
+        append = token_ids.append
+
+        # str.split() with no argument already discards leading/trailing
+        # whitespace, so no separate .strip() copy is needed.
+        for token in log_line.split():
+            token_id = lookup(token)
+            if token_id is None:
+                # Auto-expand vocabulary if capacity remains
+                if next_id < vocab_size:
+                    token_map[intern(token)] = token_id = next_id
+                    next_id += 1
+                else:
+                    # Vocabulary full — fall back to <UNK>
+                    token_id = 1
+            append(token_id)
+
+        self.next_token_id = next_id
+        if next_id >= vocab_size and not self.frozen:
+            # Vocabulary saturated: no further insertions are possible, so
+            # drop the insertion guard from the hot path for good.
+            self.freeze()
+        return tuple(token_ids)
 
     def tokenize_log(self, log_line):
         """
@@ -129,22 +366,69 @@ class LogTokenizer:
             list[int]: Token IDs corresponding to each whitespace-delimited
                        word. Unknown tokens (after vocab is full) map to 1 (<UNK>).
         """
-        tokens = log_line.strip().split()
-        token_ids = []
+        return list(self._encode_cached(log_line))
 
-        for token in tokens:
-            # Auto-expand vocabulary if capacity remains
-            if token not in self.token_map:
-                if self.next_token_id < self.vocab_size:
-                    self.token_map[token] = self.next_token_id
-                    self.next_token_id += 1
-                else:
-                    # Vocabulary full — fall back to <UNK>
-                    token = '<UNK>'
+    def tokenize_batch(self, lines, max_len=None):
+        """
+        Tokenise many log lines into a padded integer matrix.
 
-            token_ids.append(self.token_map.get(token, 1))  # 1 = <UNK>
+        Args:
+            lines:   Iterable of log line strings.
+            max_len: Row width. Longer sequences are truncated; defaults to
+                     the longest sequence in the batch.
 
-        return token_ids
+        Returns:
+            np.ndarray: int32 array of shape (n_lines, width), right-padded
+                        with 0 (<PAD>).
+        """
+        encode = self._encode_cached
+        seqs = [encode(line) for line in lines]
+        if max_len is not None:
+            seqs = [seq[:max_len] for seq in seqs]
+        lengths = np.fromiter(map(len, seqs), dtype=np.intp, count=len(seqs))
+        width = max_len if max_len is not None else int(lengths.max(initial=0))
+
+        out = np.zeros((len(seqs), width), dtype=np.int32)
+        # Scatter all ids in one assignment: row-major order of the mask
+        # matches the concatenated sequences.
+        out[np.arange(width) < lengths[:, None]] = np.fromiter(
+            chain.from_iterable(seqs), dtype=np.int32, count=int(lengths.sum())
+        )
+        return out
+
+    def bow_counts(self, lines):
+        """
+        Encode log lines as a sparse bag-of-words count matrix.
+
+        Lines are tokenised once; counting is done by scipy.sparse, which
+        sums repeated (row, token) entries — the same structure as
+        scikit-learn's CountVectorizer output.
+
+        Args:
+            lines: Sequence of log line strings.
+
+        Returns:
+            scipy.sparse.csr_matrix: int32 matrix of shape
+                (len(lines), vocab_size); entry [i, t] is the number of times
+                token id t occurs in line i. Column 1 (<UNK>) counts
+                out-of-vocabulary tokens.
+        """
+        from scipy.sparse import csr_matrix   # via scikit-learn; only needed here
+
+        encode = self._encode_cached
+        seqs = [encode(line) for line in lines]
+        indptr = np.zeros(len(seqs) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, seqs), dtype=np.int64, count=len(seqs)),
+                  out=indptr[1:])
+        ids = np.fromiter(chain.from_iterable(seqs), dtype=np.int32,
+                          count=int(indptr[-1]))
+
+        counts = csr_matrix(
+            (np.ones(len(ids), dtype=np.int32), ids, indptr),
+            shape=(len(seqs), self.vocab_size),
+        )
+        counts.sum_duplicates()
+        return counts
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -0,0 +1,39 @@
+"""
+CrashSense — Gunicorn Configuration
+=====================================
+
+Production server settings for the Flask backend. The API is I/O bound
+(psutil syscalls, watchdog events, many small JSON responses polled by the
+desktop dashboard), so requests are served by **gevent** workers: each
+worker multiplexes up to `worker_connections` concurrent pollers instead
+of handling one request at a time like the default `sync` worker.
+
+Monkey-patching:
+    The gevent worker calls `gevent.monkey.patch_all()` itself before the
+    application is imported. `preload_app` is therefore kept False so that
+    `create_app` — and the SystemMonitor / ProcessMonitor threads it starts —
+    run *after* patching, inside each worker, and cooperate with the
+    greenlet loop.
+
+Workers:
+    The backend keeps per-process state (monitor history, active session
+    UID, ML toggle), so a single worker is the default. Raise it with
+    GUNICORN_WORKERS only if that state is acceptable per worker.
+
+Usage (from backend/):
+    gunicorn -c gunicorn.conf.py 'app:create_app("production")'
+"""
+
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+
+worker_class = 'gevent'
+workers = int(os.environ.get('GUNICORN_WORKERS', 1))
+worker_connections = 1000
+
+# Workers are not recycled (no max_requests): a restart would discard the
+# 60-second metrics history the crash predictor needs.
+max_requests = 0
+
+preload_app = False
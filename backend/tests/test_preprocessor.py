@@ -0,0 +1,188 @@
+"""
+CrashSense — Preprocessor Test Suite
+=====================================
+
+Covers DataScaler normalisation and LogTokenizer encoding.
+
+Run from crash_sense/backend/ directory:
+    pytest tests/test_preprocessor.py -v
+"""
+
+import sys
+import os
+
+# ─────────────────────────────────────────────────────────
+#  Path setup — make `core.*` importable from backend/
+# ─────────────────────────────────────────────────────────
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _BACKEND_DIR not in sys.path:
+    sys.path.insert(0, _BACKEND_DIR)
+
+
+# ═══════════════════════════════════════════════════════════
+#   DataScaler
+# ═══════════════════════════════════════════════════════════
+
+class TestDataScaler:
+
+    def test_normalize_batch_matches_scalar_path(self):
+        from core.preprocessor import DataScaler
+
+        scaler = DataScaler()
+        samples = [
+            {"timestamp": 1.0, "cpu_percent": 50.0, "memory_percent": 25.0,
+             "disk_read_bytes": 4096, "disk_write_bytes": 0,
+             "net_bytes_sent": 10**9, "net_bytes_recv": 123},
+            {"timestamp": 2.0, "cpu_percent": 100.0},
+        ]
+        columns = scaler.normalize_batch(samples)
+
+        for i, sample in enumerate(samples):
+            expected = scaler.normalize_metrics(sample)
+            for key, values in columns.items():
+                assert abs(values[i] - expected[key]) < 1e-12
+
+    def test_normalize_vector_round_trips_through_as_dict(self):
+        from core.preprocessor import DataScaler
+
+        scaler = DataScaler()
+        sample = {"timestamp": 7.0, "cpu_percent": 80.0, "memory_percent": 40.0,
+                  "disk_read_bytes": 1024, "disk_write_bytes": 2048,
+                  "net_bytes_sent": 5, "net_bytes_recv": 0}
+        vector = scaler.normalize_vector(sample)
+        expected = scaler.normalize_metrics(sample)
+
+        assert vector.shape == (6,)
+        as_dict = scaler.as_dict(vector, sample["timestamp"])
+        assert as_dict.keys() == expected.keys()
+        for key, value in expected.items():
+            assert abs(as_dict[key] - value) < 1e-12
+
+    def test_float32_output_and_unit_quantisation(self):
+        import numpy as np
+        from core.preprocessor import DataScaler, UNIT_SCALE
+
+        scaler = DataScaler()
+        columns = scaler.normalize_batch(
+            [{"cpu_percent": 33.3, "memory_percent": 101.0}], dtype=np.float32)
+        assert columns["cpu_percent"].dtype == np.float32
+
+        q = scaler.quantize_unit(np.array([0.0, 0.333, 1.01]))
+        assert q.dtype == np.uint16
+        assert q[0] == 0 and q[2] == 65535
+        assert abs(q[1] * UNIT_SCALE - 0.333) <= UNIT_SCALE / 2
+
+    def test_quantize_unit_accepts_scalars(self):
+        import numpy as np
+        from core.preprocessor import DataScaler
+
+        for value in (0.5, np.float32(0.5), 1):
+            q = DataScaler.quantize_unit(value)
+            assert q.dtype == np.uint16 and q.shape == ()
+        assert DataScaler.quantize_unit(0.5) == 32768
+        assert DataScaler.quantize_unit(1) == 65535
+
+    def test_null_counters_scale_as_zero(self):
+        from core.preprocessor import DataScaler
+
+        scaler = DataScaler()
+        sample = {"cpu_percent": 10.0, "memory_percent": 20.0,
+                  "disk_read_bytes": None, "disk_write_bytes": None,
+                  "net_bytes_sent": None, "net_bytes_recv": None}
+
+        assert scaler.normalize_metrics(sample)["disk_read_bytes"] == 0.0
+        assert scaler.normalize_vector(sample)[2:].sum() == 0.0
+        assert scaler.normalize_batch([sample])["net_bytes_sent"][0] == 0.0
+
+    def test_push_fills_ring_in_order_and_wraps(self):
+        import numpy as np
+        from core.preprocessor import DataScaler
+
+        scaler = DataScaler(ring_size=3)
+        samples = [{"cpu_percent": float(i), "disk_read_bytes": i} for i in range(5)]
+        for sample in samples:
+            scaler.push(sample)
+
+        ring = scaler.get_ring_array()
+        assert ring.dtype == np.float32
+        assert ring.shape == (3, 6)
+        for row, sample in zip(ring, samples[2:]):
+            np.testing.assert_allclose(row, scaler.normalize_vector(sample), rtol=1e-6)
+
+    def test_normalize_batch_empty(self):
+        from core.preprocessor import DataScaler
+
+        columns = DataScaler().normalize_batch([])
+        assert all(len(v) == 0 for v in columns.values())
+
+
+# ═══════════════════════════════════════════════════════════
+#   LogTokenizer
+# ═══════════════════════════════════════════════════════════
+
+class TestLogTokenizer:
+
+    def test_tokenize_batch_pads_with_zero(self):
+        from core.preprocessor import LogTokenizer
+
+        tok = LogTokenizer()
+        batch = tok.tokenize_batch(["ERROR: OOM in AuthService", "", "ERROR: retry"])
+
+        assert batch.dtype.name == "int32"
+        assert batch.shape == (3, 4)
+        assert list(batch[0]) == tok.tokenize_log("ERROR: OOM in AuthService")
+        assert list(batch[1]) == [0, 0, 0, 0]
+        assert list(batch[2]) == tok.tokenize_log("ERROR: retry") + [0, 0]
+
+    def test_tokenize_batch_truncates_to_max_len(self):
+        from core.preprocessor import LogTokenizer
+
+        tok = LogTokenizer()
+        batch = tok.tokenize_batch(["a b c d", "a"], max_len=2)
+
+        assert batch.shape == (2, 2)
+        assert list(batch[1]) == [tok.token_map["a"], 0]
+
+    def test_frozen_vocabulary_maps_unseen_to_unk(self):
+        from core.preprocessor import LogTokenizer
+
+        tok = LogTokenizer()
+        known = tok.tokenize_log("disk full")
+        tok.freeze()
+
+        assert tok.tokenize_log("disk quota full") == [known[0], 1, known[1]]
+        assert "quota" not in tok.token_map
+
+    def test_repeated_line_is_memoised_and_returns_fresh_list(self):
+        from core.preprocessor import LogTokenizer
+
+        tok = LogTokenizer()
+        first = tok.tokenize_log("WARN: high latency")
+        first.append(99)
+        second = tok.tokenize_log("WARN: high latency")
+
+        assert second == first[:-1]
+        assert tok._encode_cached.cache_info().hits == 1
+
+    def test_saturated_vocabulary_freezes(self):
+        from core.preprocessor import LogTokenizer
+
+        tok = LogTokenizer(vocab_size=4)
+        ids = tok.tokenize_log("alpha beta gamma")
+
+        assert ids == [2, 3, 1]
+        assert tok.frozen
+        assert tok.tokenize_log("beta delta") == [3, 1]
+
+    def test_bow_counts_sums_repeated_tokens(self):
+        from core.preprocessor import LogTokenizer
+
+        tok = LogTokenizer(vocab_size=16)
+        counts = tok.bow_counts(["error error disk", "", "disk"])
+        dense = counts.toarray()
+
+        assert counts.shape == (3, 16)
+        assert dense[0, tok.token_map["error"]] == 2
+        assert dense[0, tok.token_map["disk"]] == 1
+        assert dense[1].sum() == 0
+        assert dense[2].sum() == 1
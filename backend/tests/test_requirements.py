@@ -118,6 +118,21 @@ class TestTC01_Collector500ms:
         )
         assert all(r["timestamp"] > mid for r in after_mid)
 
+    def test_history_array_matches_history(self):
+        from core.collector import SystemMonitor, METRIC_FIELDS
+
+        monitor = SystemMonitor(history_size=3, poll_interval=0.5)
+        monitor.start()
+        time.sleep(2.6)   # enough ticks to wrap the 3-row ring buffer
+        monitor.stop()
+
+        history = monitor.get_history()
+        matrix = monitor.get_history_array()
+
+        assert matrix.shape == (len(history), len(METRIC_FIELDS))
+        for row, rec in zip(matrix, history):
+            assert list(row) == [float(rec[k]) for k in METRIC_FIELDS]
+
 
 # ═══════════════════════════════════════════════════════════
 #   TC-02 — FR-02: Real-time log parsing (<100ms)
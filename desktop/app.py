@@ -5,9 +5,9 @@ CrashSense — Main Application Entry Point
 Orchestrates the entire desktop application lifecycle:
     1. Initialises the CustomTkinter window and dark theme.
     2. Manages the **authentication flow** (Login ↔ SignUp ↔ Main Dashboard).
-    3. Handles **screen navigation** via sidebar — each navigation event
-       destroys the old screen widget and lazily creates the new one to keep
-       memory usage minimal.
+    3. Handles **screen navigation** via sidebar — screens are created lazily
+       on first visit, then cached and re-packed on later visits so their
+       charts and widget trees are not rebuilt on every click.
     4. Provides a unified logout handler that tears down the current session
        and returns to the login screen.
 
@@ -21,7 +21,7 @@ Architecture:
     │       └── right_panel                                     │
     │            ├── TopBar   (top, fixed 72px)                 │
     │            └── _content_frame  (fills remaining space)    │
-    │                 └── <ActiveScreen>  (lazy-loaded)         │
+    │                 └── <ActiveScreen>  (lazy-loaded, cached) │
     └────────────────────────────────────────────────────────────┘
 
 Usage:
@@ -32,6 +32,7 @@ Usage:
 import sys
 import os
 import subprocess
+import importlib
 
 # ── Ensure the project root is on sys.path ──────────────────────
 # This allows `from backend.core.collector import SystemMonitor`
@@ -54,23 +55,36 @@ def get_asset_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 # ── Internal imports ────────────────────────────────────────────
-from desktop.theme import BG_ROOT, FONT_FAMILY
+from desktop.theme import BG_ROOT, FONT_FAMILY, SEVERITY_RANK
 from desktop.components.sidebar import Sidebar
 from desktop.components.topbar import TopBar
+from desktop.icons import preload_icons
 from desktop.screens.login import LoginScreen
 from desktop.screens.signup import SignUpScreen
-from desktop.screens.dashboard import DashboardScreen
-from desktop.screens.alerts import AlertsScreen
-from desktop.screens.crash_details import CrashDetailsScreen
-from desktop.screens.logs import LogsScreen
-from desktop.screens.prediction import PredictionScreen
-from desktop.screens.settings import SettingsScreen
-from desktop.screens.profile import ProfileScreen
 from desktop import session
 from desktop.notifier import crash_warning_notifier
 from desktop.tray import SystemTrayManager
 from desktop.components.notification_toast import NotificationToast
 
+# Main screens are imported on first visit rather than at startup: the
+# dashboard, prediction and crash-details modules pull in matplotlib, which
+# the login window does not need.
+_SCREEN_CLASSES = {
+    "dashboard":     ("desktop.screens.dashboard",     "DashboardScreen"),
+    "alerts":        ("desktop.screens.alerts",        "AlertsScreen"),
+    "crash-details": ("desktop.screens.crash_details", "CrashDetailsScreen"),
+    "logs":          ("desktop.screens.logs",          "LogsScreen"),
+    "prediction":    ("desktop.screens.prediction",    "PredictionScreen"),
+    "profile":       ("desktop.screens.profile",       "ProfileScreen"),
+    "settings":      ("desktop.screens.settings",      "SettingsScreen"),
+}
+
+
+def _import_screen(screen_id):
+    """Import and return the screen class for `screen_id`."""
+    module_name, class_name = _SCREEN_CLASSES[screen_id]
+    return getattr(importlib.import_module(module_name), class_name)
+
 
 class CrashSenseApp(ctk.CTk):
     """
@@ -79,17 +93,29 @@ class CrashSenseApp(ctk.CTk):
     Responsibilities:
         - Window configuration (title, geometry, dark theme)
         - Authentication flow management (login ↔ signup ↔ main)
-        - Screen lifecycle management (create / destroy on navigation)
+        - Screen lifecycle management (create on first visit, hide / show
+          afterwards, destroy on logout)
 
     Attributes:
         _current_screen_id (str):           Active screen identifier (e.g. 'dashboard').
         _current_screen_widget (CTkFrame):  Reference to the currently displayed screen
-                                            widget; destroyed on every navigation event.
+                                            widget.
+        _screens (dict[str, CTkFrame]):     Screens created so far this session, keyed by
+                                            screen id. Hidden screens are paused through
+                                            their optional `on_hide()` / `on_show()` hooks
+                                            (see `desktop.screens.base`). The login and
+                                            sign-up screens are not in here: they are
+                                            built once in `__init__` and reused already.
     """
 
     def __init__(self):
         super().__init__()
 
+        # Render the Sidebar and TopBar icons while the window, tray,
+        # backend daemon and auth screens are being set up below, so
+        # building the main layout only hits the icon cache.
+        preload_icons((*Sidebar.ICON_SPECS, *TopBar.ICON_SPECS.values()))
+
         # ── Window configuration ────────────────────────────────
         self.title("CrashSense v1.1.3 — App Crash Detection & Prediction System")
         self.geometry("1280x800")
@@ -109,6 +135,7 @@ class CrashSenseApp(ctk.CTk):
         # Track which screen is currently visible
         self._current_screen_id = "dashboard"
         self._current_screen_widget = None
+        self._screens = {}
         self._warning_banner = None  # In-app crash warning banner
 
         # ── Background Daemon / System Tray ─────────────────────
@@ -349,9 +376,11 @@ class CrashSenseApp(ctk.CTk):
         """End the current session and return to the login screen."""
         crash_warning_notifier.stop()
         session.clear_user()
-        if self._current_screen_widget:
-            self._current_screen_widget.destroy()
-            self._current_screen_widget = None
+        # Cached screens hold per-user data — discard them all.
+        for screen in self._screens.values():
+            screen.destroy()
+        self._screens.clear()
+        self._current_screen_widget = None
         if self._warning_banner:
             try: self._warning_banner.destroy()
             except Exception: pass
@@ -364,8 +393,7 @@ class CrashSenseApp(ctk.CTk):
         if not alerts or self._destroyed if hasattr(self, '_destroyed') else False:
             return
         # Pick the highest-severity alert to show in the banner
-        sev_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-        top = sorted(alerts, key=lambda a: sev_order.get(a.get("severity", "low"), 3))[0]
+        top = min(alerts, key=lambda a: SEVERITY_RANK.get(a.get("severity", "low"), 3))
         self.after(0, lambda: self._show_warning_banner(top))
 
     def _show_warning_banner(self, alert: dict):
@@ -500,12 +528,17 @@ class CrashSenseApp(ctk.CTk):
             screen_id: One of 'dashboard', 'alerts', 'crash-details',
                        'logs', 'prediction', 'settings'.
 
-        The previous screen widget is destroyed before the new one is created.
-        This ensures only one screen's widgets exist in memory at a time.
+        The previous screen is hidden (pack_forget) and paused via its
+        `on_hide()` hook. A screen visited before is re-packed and resumed
+        via `on_show()`; otherwise it is created and cached.
         """
-        # Tear down the previous screen
-        if self._current_screen_widget:
-            self._current_screen_widget.destroy()
+        # Hide the previous screen
+        previous = self._current_screen_widget
+        if previous:
+            previous.pack_forget()
+            on_hide = getattr(previous, "on_hide", None)
+            if on_hide:
+                on_hide()
             self._current_screen_widget = None
 
         self._current_screen_id = screen_id
@@ -516,20 +549,26 @@ class CrashSenseApp(ctk.CTk):
         # Highlight the active item in the sidebar
         self._sidebar.set_active(screen_id)
 
-        # Lazy-create the requested screen via a factory map
-        screen_factories = {
-            "dashboard":     lambda: DashboardScreen(self._content_frame),
-            "alerts":        lambda: AlertsScreen(self._content_frame),
-            "crash-details": lambda: CrashDetailsScreen(self._content_frame),
-            "logs":          lambda: LogsScreen(self._content_frame),
-            "prediction":    lambda: PredictionScreen(self._content_frame),
-            "profile":       lambda: ProfileScreen(self._content_frame),
-            "settings":      lambda: SettingsScreen(self._content_frame, on_logout=self._handle_logout),
-        }
-
-        factory = screen_factories.get(screen_id, screen_factories["dashboard"])
-        self._current_screen_widget = factory()
-        self._current_screen_widget.pack(fill="both", expand=True)
+        if screen_id not in _SCREEN_CLASSES:
+            screen_id = "dashboard"
+
+        # Reuse the cached screen if this one was visited before; otherwise
+        # import its module (first visit only) and create it.
+        screen = self._screens.get(screen_id)
+        if screen is None:
+            screen_cls = _import_screen(screen_id)
+            if screen_id == "settings":
+                screen = screen_cls(self._content_frame, on_logout=self._handle_logout)
+            else:
+                screen = screen_cls(self._content_frame)
+            self._screens[screen_id] = screen
+            screen.pack(fill="both", expand=True)
+        else:
+            screen.pack(fill="both", expand=True)
+            on_show = getattr(screen, "on_show", None)
+            if on_show:
+                on_show()
+        self._current_screen_widget = screen
 
     # ── Window Lifecycle ─────────────────────────────────────────
 
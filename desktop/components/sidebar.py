@@ -20,9 +20,11 @@ Usage:
 import customtkinter as ctk
 from desktop.theme import (
     BG_SIDEBAR, ORANGE, ORANGE_BG, TEXT_SECONDARY, TEXT_MUTED,
-    BORDER, FONT_FAMILY, NAV_ITEMS, TEXT_PRIMARY,
+    BORDER, NAV_ITEMS, TEXT_PRIMARY,
 )
 from desktop.icons import get_icon
+from desktop.fonts import get_font
+from desktop.wheel import bind_wheel
 import os
 import sys
 from PIL import Image
@@ -52,8 +54,36 @@ class Sidebar(ctk.CTkFrame):
         _active (str):              Currently highlighted screen id.
         _buttons (dict[str, btn]):  Map of screen_id → CTkButton for
                                     programmatic style updates.
+
+    Lifetime:
+        CrashSenseApp builds one Sidebar for the life of the window; logout
+        only hides the main frame. Nav, logout and quit icons come from
+        `desktop.icons.get_icon`, whose module-level cache already returns
+        the same CTkImage for a given (name, size, color), so no
+        per-instance icon pool is kept here.
     """
 
+    _brand_image = None
+
+    # Every (name, size, color) this widget passes to get_icon(): an inactive
+    # and an active icon per nav item, then logout and quit. CrashSenseApp
+    # preloads these off the UI thread (see `desktop.icons.preload_icons`).
+    QUIT_COLOR = "#ef4444"
+    ICON_SPECS = (
+        *((item["id"], 18, color) for item in NAV_ITEMS for color in (TEXT_SECONDARY, ORANGE)),
+        ("logout", 18, TEXT_SECONDARY),
+        ("power",  18, QUIT_COLOR),
+    )
+
+    @classmethod
+    def _get_brand_image(cls):
+        """Decode and resize assets/icon.png once; reuse the CTkImage after."""
+        if cls._brand_image is None:
+            icon_path = get_asset_path("desktop/assets/icon.png")
+            pil_icon = Image.open(icon_path).resize((36, 36), Image.LANCZOS)
+            cls._brand_image = ctk.CTkImage(light_image=pil_icon, dark_image=pil_icon, size=(36, 36))
+        return cls._brand_image
+
     def __init__(self, master, on_navigate, on_logout, on_quit=None, **kwargs):
         super().__init__(master, width=260, fg_color=BG_SIDEBAR, corner_radius=0, **kwargs)
         self.pack_propagate(False)   # Enforce fixed 260px width
@@ -61,18 +91,17 @@ class Sidebar(ctk.CTkFrame):
         self._on_navigate = on_navigate
         self._on_logout = on_logout
         self._on_quit = on_quit
-        self._active = "dashboard"   # Default active screen
+        self._active = None          # Set to "dashboard" at the end of __init__
         self._buttons = {}
-        self._icons = {}             # Store icon references to prevent GC
+        self._icons_default = {}     # screen_id → inactive nav icon
+        self._icons_active = {}      # screen_id → active (orange) nav icon
 
         # ── Branding Section ────────────────────────────────────
         brand_frame = ctk.CTkFrame(self, fg_color="transparent")
         brand_frame.pack(fill="x", padx=20, pady=(24, 4))
 
-        # App logo icon (loaded from assets/icon.png)
-        icon_path = get_asset_path("desktop/assets/icon.png")
-        pil_icon = Image.open(icon_path).resize((36, 36), Image.LANCZOS)
-        self._brand_icon = ctk.CTkImage(light_image=pil_icon, dark_image=pil_icon, size=(36, 36))
+        # App logo icon (loaded from assets/icon.png, shared across instances)
+        self._brand_icon = self._get_brand_image()
 
         logo_label = ctk.CTkLabel(brand_frame, image=self._brand_icon, text="")
         logo_label.pack(side="left")
@@ -82,12 +111,12 @@ class Sidebar(ctk.CTkFrame):
         title_frame.pack(side="left", padx=(12, 0))
         ctk.CTkLabel(
             title_frame, text="CRASH SENSE",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=17, weight="bold"),
+            font=get_font(17, "bold"),
             text_color=TEXT_PRIMARY,
         ).pack(anchor="w")
         ctk.CTkLabel(
             title_frame, text="Crash Detection System",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=12),
+            font=get_font(12),
             text_color=TEXT_SECONDARY,
         ).pack(anchor="w")
 
@@ -110,24 +139,16 @@ class Sidebar(ctk.CTkFrame):
             self._buttons[item["id"]] = btn
 
         # Bind mouse wheel for scrolling within the sidebar
-        def _scroll_up(e):
-            try: nav_scroll._parent_canvas.yview_scroll(-3, "units")
-            except Exception: pass
-        def _scroll_down(e):
-            try: nav_scroll._parent_canvas.yview_scroll(3, "units")
-            except Exception: pass
-        nav_scroll.bind_all("<Button-4>", _scroll_up)
-        nav_scroll.bind_all("<Button-5>", _scroll_down)
+        bind_wheel(nav_scroll, nav_scroll)
 
         # ── Logout Button (bottom) ──────────────────────────────
         ctk.CTkFrame(self, height=1, fg_color=BORDER).pack(fill="x", padx=16, pady=(0, 8))
 
         logout_icon = get_icon("logout", size=18, color=TEXT_SECONDARY)
-        self._icons["logout"] = logout_icon
         logout_btn = ctk.CTkButton(
             self, text="  Logout", anchor="w",
             image=logout_icon, compound="left",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=14),
+            font=get_font(14),
             fg_color="transparent", hover_color="#2a0f0f",
             text_color=TEXT_SECONDARY, height=44, corner_radius=10,
             command=self._on_logout,
@@ -135,14 +156,13 @@ class Sidebar(ctk.CTkFrame):
         logout_btn.pack(fill="x", padx=12, pady=(0, 2))
 
         # ── Quit Application Button ──────────────────────────────
-        power_icon = get_icon("power", size=18, color="#ef4444")
-        self._icons["quit"] = power_icon
+        power_icon = get_icon("power", size=18, color=self.QUIT_COLOR)
         quit_btn = ctk.CTkButton(
             self, text="  Quit Application", anchor="w",
             image=power_icon, compound="left",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=14, weight="bold"),
+            font=get_font(14, "bold"),
             fg_color="transparent", hover_color="#450a0a",
-            text_color="#ef4444", height=44, corner_radius=10,
+            text_color=self.QUIT_COLOR, height=44, corner_radius=10,
             command=self._on_quit,
         )
         quit_btn.pack(fill="x", padx=12, pady=(0, 20))
@@ -165,7 +185,8 @@ class Sidebar(ctk.CTkFrame):
         """
         icon_default = get_icon(item["id"], size=18, color=TEXT_SECONDARY)
         icon_active = get_icon(item["id"], size=18, color=ORANGE)
-        self._icons[item["id"]] = {"default": icon_default, "active": icon_active}
+        self._icons_default[item["id"]] = icon_default
+        self._icons_active[item["id"]] = icon_active
 
         btn = ctk.CTkButton(
             parent,
@@ -173,7 +194,7 @@ class Sidebar(ctk.CTkFrame):
             image=icon_default,
             compound="left",
             anchor="w",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=14),
+            font=get_font(14),
             fg_color="transparent",
             hover_color="#1a1c24",
             text_color=TEXT_SECONDARY,
@@ -195,18 +216,23 @@ class Sidebar(ctk.CTkFrame):
         """
         Programmatically set the active navigation item.
 
-        Highlights the target item with orange styling and resets all
-        others to the default secondary colour.
+        Highlights the target item with orange styling and resets the
+        previously active item to the default secondary colour.
 
         Args:
             screen_id: Identifier matching one of NAV_ITEMS[*]['id'].
         """
+        prev = self._active
+        if prev == screen_id:
+            return
+        # Only the outgoing and incoming buttons change — reconfigure just
+        # those two instead of every nav item.
+        old = self._buttons.get(prev)
+        if old is not None:
+            old.configure(fg_color="transparent", text_color=TEXT_SECONDARY,
+                          image=self._icons_default.get(prev))
+        new = self._buttons.get(screen_id)
+        if new is not None:
+            new.configure(fg_color=ORANGE_BG, text_color=ORANGE,
+                          image=self._icons_active.get(screen_id))
         self._active = screen_id
-        for sid, btn in self._buttons.items():
-            icons = self._icons.get(sid)
-            if sid == screen_id:
-                btn.configure(fg_color=ORANGE_BG, text_color=ORANGE,
-                              image=icons["active"] if icons else None)
-            else:
-                btn.configure(fg_color="transparent", text_color=TEXT_SECONDARY,
-                              image=icons["default"] if icons else None)
@@ -22,15 +22,29 @@ Usage:
     topbar.set_screen("alerts")  # updates title, shows back button
 """
 
+import inspect
+import weakref
+
 import customtkinter as ctk
 from desktop.theme import (
     BG_TOPBAR, BORDER, ORANGE, RED, RED_BG,
-    TEXT_PRIMARY, TEXT_SECONDARY, FONT_FAMILY,
+    TEXT_PRIMARY, TEXT_SECONDARY,
 )
 from desktop.icons import get_icon
+from desktop.fonts import get_font
 from desktop import session
 
 
+def _weak_callback(cb):
+    """Hold a bound-method callback weakly; other callables are kept as-is."""
+    return weakref.WeakMethod(cb) if inspect.ismethod(cb) else cb
+
+
+def _resolve(ref):
+    """Return the live callable behind `_weak_callback`, or None if gone."""
+    return ref() if isinstance(ref, weakref.WeakMethod) else ref
+
+
 class TopBar(ctk.CTkFrame):
     """
     Top navigation bar with contextual title, notifications, and logout.
@@ -42,10 +56,22 @@ class TopBar(ctk.CTkFrame):
 
     Attributes:
         _title (CTkLabel):     Dynamic page title label.
+        _title_var (StringVar): Text variable bound to `_title`.
         _subtitle (CTkLabel):  Static subtitle below the title.
-        _back_btn (CTkButton): Back arrow — pack/pack_forget toggles visibility.
+        _back_btn (CTkButton): Back arrow — grid/grid_remove toggles visibility.
+        _back_visible (bool):  Whether `_back_btn` is currently shown.
+        _current_screen (str): Screen id last passed to `set_screen`.
     """
 
+    # get_icon() arguments for every TopBar icon; CrashSenseApp hands these
+    # to `preload_icons` so construction only hits the icon cache. Fonts
+    # need the Tk thread and come from `get_font` during construction.
+    ICON_SPECS = {
+        "back":  ("back_arrow", 16, TEXT_SECONDARY),
+        "bell":  ("bell",       16, TEXT_SECONDARY),
+        "power": ("power",      16, RED),
+    }
+
     # ── Screen-specific titles ──────────────────────────────────
     SCREEN_TITLES = {
         "dashboard":     "Dashboard",
@@ -56,18 +82,28 @@ class TopBar(ctk.CTkFrame):
         "settings":      "Settings",
         "profile":       "My Profile",
     }
+    # screen_id → (title, show back button); one lookup per navigation.
+    # Unknown ids fall back to ("Dashboard", True), as before. A str-keyed
+    # dict hit is a cached-hash probe plus an identity check on the interned
+    # literal, so an if/`is` chain would not be faster, and would break on
+    # ids built at runtime.
+    SCREEN_META = {sid: (title, sid != "dashboard") for sid, title in SCREEN_TITLES.items()}
 
     def __init__(self, master, on_logout, on_back=None, on_profile=None, on_alerts=None, **kwargs):
         super().__init__(master, height=72, fg_color=BG_TOPBAR, corner_radius=0, **kwargs)
         self.pack_propagate(False)    # Enforce fixed 72px height
 
-        self._on_logout = on_logout
-        self._on_back = on_back
-        self._on_profile = on_profile
-        self._on_alerts = on_alerts
+        # Children are packed as they are built. Tk does not lay out on each
+        # pack() call: geometry requests are coalesced into one idle-time
+        # pass, and CrashSenseApp builds the TopBar while its main frame is
+        # still unmapped, so construction costs a single layout.
 
-        # Keep icon references to prevent garbage collection
-        self._icons = {}
+        # Bound-method callbacks are held weakly so the bar never keeps
+        # its owner alive (see `_weak_callback`); lambdas stay strong.
+        self._on_logout = _weak_callback(on_logout)
+        self._on_back = _weak_callback(on_back)
+        self._on_profile = _weak_callback(on_profile)
+        self._on_alerts = _weak_callback(on_alerts)
 
         # ── Bottom border ───────────────────────────────────────
         border = ctk.CTkFrame(self, height=1, fg_color=BORDER)
@@ -77,12 +113,16 @@ class TopBar(ctk.CTkFrame):
         inner.pack(fill="both", expand=True, padx=24)
 
         # ── Left section: back button + page title ──────────────
+        # Fixed two-column grid: back button in column 0, title in column 1.
+        # The button keeps its grid slot options while hidden, so
+        # set_screen() toggles it with a bare grid() / grid_remove().
         left = ctk.CTkFrame(inner, fg_color="transparent")
         left.pack(side="left", fill="y")
+        left.grid_rowconfigure(0, weight=1)      # Centre vertically, as pack did
 
         # Back button (hidden by default; shown on non-dashboard screens)
-        back_icon = get_icon("back_arrow", size=16, color=TEXT_SECONDARY)
-        self._icons["back"] = back_icon
+        # get_icon's module cache keeps the CTkImage alive; no local ref needed.
+        back_icon = get_icon(*self.ICON_SPECS["back"])
         self._back_btn = ctk.CTkButton(
             left, text="", width=40, height=40, corner_radius=10,
             image=back_icon,
@@ -90,34 +130,43 @@ class TopBar(ctk.CTkFrame):
             text_color=TEXT_SECONDARY,
             command=self._handle_back,
         )
-        self._back_btn.pack(side="left", padx=(0, 12))
-        self._back_btn.pack_forget()   # Hidden for dashboard
+        self._back_btn.grid(row=0, column=0, padx=(0, 12))
+        self._back_btn.grid_remove()   # Hidden for dashboard
+        self._back_visible = False
+        self._current_screen = None
 
         # Page title and subtitle
         title_frame = ctk.CTkFrame(left, fg_color="transparent")
-        title_frame.pack(side="left")
+        title_frame.grid(row=0, column=1, sticky="w")
 
+        # The title is driven through a Tcl variable: set_screen() then costs
+        # one variable write instead of a CTkLabel.configure() round trip.
+        self._title_var = ctk.StringVar(master=self, value="Dashboard")
         self._title = ctk.CTkLabel(
-            title_frame, text="Dashboard",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=20, weight="bold"),
+            title_frame, textvariable=self._title_var,
+            font=get_font(20, "bold"),
             text_color=TEXT_PRIMARY,
         )
         self._title.pack(anchor="w")
 
         self._subtitle = ctk.CTkLabel(
             title_frame, text="Real-time system monitoring and analysis",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=11),
+            font=get_font(11),
             text_color=TEXT_SECONDARY,
         )
         self._subtitle.pack(anchor="w")
 
         # ── Right section: actions ──────────────────────────────
+        # Every widget here has a fixed size inside a fixed-height bar, so a
+        # window resize never changes their allocation and CustomTkinter
+        # does not redraw them; only the left section re-renders on
+        # set_screen(). Tk has no portable widget-to-PhotoImage capture, so
+        # there is nothing further to gain from caching this as a bitmap.
         right = ctk.CTkFrame(inner, fg_color="transparent")
         right.pack(side="right", fill="y")
 
         # Notification bell
-        bell_icon = get_icon("bell", size=16, color=TEXT_SECONDARY)
-        self._icons["bell"] = bell_icon
+        bell_icon = get_icon(*self.ICON_SPECS["bell"])
         notif_btn = ctk.CTkButton(
             right, text="", width=40, height=40, corner_radius=10,
             image=bell_icon,
@@ -128,14 +177,13 @@ class TopBar(ctk.CTkFrame):
         notif_btn.pack(side="left", padx=4)
 
         # Logout / power-off button (red-tinted)
-        power_icon = get_icon("power", size=16, color=RED)
-        self._icons["power"] = power_icon
+        power_icon = get_icon(*self.ICON_SPECS["power"])
         logout_btn = ctk.CTkButton(
             right, text="", width=40, height=40, corner_radius=10,
             image=power_icon,
             fg_color=RED_BG, hover_color="#3a1515",
             text_color=RED,
-            command=self._on_logout,
+            command=self._handle_logout,
         )
         logout_btn.pack(side="left", padx=4)
 
@@ -150,7 +198,7 @@ class TopBar(ctk.CTkFrame):
         self._avatar_frame.pack_propagate(False)
         self._avatar_label = ctk.CTkLabel(
             self._avatar_frame, text=initials,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13, weight="bold"),
+            font=get_font(13, "bold"),
             text_color="#ffffff",
         )
         self._avatar_label.pack(expand=True)
@@ -169,13 +217,23 @@ class TopBar(ctk.CTkFrame):
         Args:
             screen_id: Identifier from NAV_ITEMS (e.g. 'alerts', 'logs').
         """
-        self._title.configure(text=self.SCREEN_TITLES.get(screen_id, "Dashboard"))
-
-        if screen_id == "dashboard":
-            self._back_btn.pack_forget()
+        if screen_id == self._current_screen:
+            return
+        self._current_screen = screen_id
+
+        title, show_back = self.SCREEN_META.get(screen_id, ("Dashboard", True))
+        if title != self._title_var.get():
+            self._title_var.set(title)
+
+        # Showing or hiding the back button re-runs geometry for the bar —
+        # only when the visibility actually changes.
+        if show_back == self._back_visible:
+            return
+        self._back_visible = show_back
+        if show_back:
+            self._back_btn.grid()      # Restores the remembered row/column/padx
         else:
-            # Re-pack the back button before the title frame
-            self._back_btn.pack(side="left", padx=(0, 12), before=self._title.master)
+            self._back_btn.grid_remove()
 
 
 
@@ -186,17 +244,26 @@ class TopBar(ctk.CTkFrame):
 
     # ── Private Helpers ─────────────────────────────────────────
 
+    def _handle_logout(self):
+        """Invoke the on_logout callback."""
+        cb = _resolve(self._on_logout)
+        if cb:
+            cb()
+
     def _handle_back(self):
         """Invoke the on_back callback (typically navigates to dashboard)."""
-        if self._on_back:
-            self._on_back()
+        cb = _resolve(self._on_back)
+        if cb:
+            cb()
 
     def _handle_profile(self):
         """Navigate to the profile screen."""
-        if self._on_profile:
-            self._on_profile()
+        cb = _resolve(self._on_profile)
+        if cb:
+            cb()
 
     def _handle_alerts(self):
         """Navigate to the alerts screen."""
-        if self._on_alerts:
-            self._on_alerts()
+        cb = _resolve(self._on_alerts)
+        if cb:
+            cb()
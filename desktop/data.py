@@ -17,8 +17,38 @@ Sections:
     - Resource metrics   (resource chart at time of crash)
     - Full logs          (paginated log table)
     - Users              (settings → user management)
+
+DASHBOARD_METRICS values are `KpiMetric` records (attribute access, e.g.
+`m.value`). The dashboard rewrites their fields on every poll, so the record
+is a mutable slotted dataclass.
+
+Chart series are dicts of columns: `data["time"]` labels plus read-only
+NumPy value arrays.
+
+Only the dashboard reads this module today. The Alerts, Crash Details,
+Logs and Settings screens fetch live data from the backend, so ALERTS,
+CRASH_INCIDENT, LOG_ENTRIES, RESOURCE_METRICS, FULL_LOGS and USERS are
+currently unused demo fixtures and keep their original list-of-dict layout.
+
+Lazy loading:
+    Each table is built by a cached `get_<name>()` loader on first use, so
+    importing this module allocates nothing. The upper-case names remain
+    importable (`from desktop.data import ALERTS`) through a module-level
+    `__getattr__` (PEP 562) that calls the matching loader.
 """
 
+from dataclasses import dataclass
+from functools import cache
+
+
+@dataclass(slots=True)
+class KpiMetric:
+    value: str
+    label: str
+    sub: str
+    trend: str
+    trend_up: bool
+
 
 # ═══════════════════════════════════════════════════════════════
 #  DASHBOARD SCREEN DATA
@@ -31,51 +61,68 @@ Sections:
 #   sub       – contextual subtitle
 #   trend     – percentage or count change indicator
 #   trend_up  – True if the trend is negative (red), False if positive (green)
-DASHBOARD_METRICS = {
-    "process_count": {
-        "value": "--", "label": "Processes",
-        "sub": "Loading...", "trend": "Live", "trend_up": False,
-    },
-    "uptime": {
-        "value": "--", "label": "System Uptime",
-        "sub": "Loading...", "trend": "Live", "trend_up": False,
-    },
-    "cpu_usage": {
-        "value": "--", "label": "CPU Usage",
-        "sub": "Loading...", "trend": "Live", "trend_up": False,
-    },
-    "thread_count": {
-        "value": "--", "label": "Active Threads",
-        "sub": "Loading...", "trend": "Live", "trend_up": False,
-    },
-}
+@cache
+def get_dashboard_metrics():
+    return {
+        "process_count": KpiMetric(
+            value="--", label="Processes",
+            sub="Loading...", trend="Live", trend_up=False,
+        ),
+        "uptime": KpiMetric(
+            value="--", label="System Uptime",
+            sub="Loading...", trend="Live", trend_up=False,
+        ),
+        "cpu_usage": KpiMetric(
+            value="--", label="CPU Usage",
+            sub="Loading...", trend="Live", trend_up=False,
+        ),
+        "thread_count": KpiMetric(
+            value="--", label="Active Threads",
+            sub="Loading...", trend="Live", trend_up=False,
+        ),
+    }
+
+
+# Time-series tables are stored column-wise (struct-of-arrays): a dict of
+# one label tuple plus read-only NumPy value arrays, so charts can hand the
+# columns straight to Matplotlib without rebuilding lists per draw.
+# Values are small non-negative integers (percentages, counts) → uint8;
+# every series here, including RESOURCE_METRICS["threads"], stays below 256.
+# Labels stay tuples of str: Matplotlib treats them as categories either way.
+def _column(values):
+    import numpy as np   # deferred with the tables themselves
+    arr = np.array(values, dtype=np.uint8)
+    arr.setflags(write=False)
+    return arr
+
+
+TREND_TIMES = ("00:00", "04:00", "08:00", "12:00", "16:00", "20:00", "23:59")
 
 # Crash frequency data points for the 24-hour trend line chart.
-CRASH_TREND_DATA = [
-    {"time": "00:00", "crashes": 2},
-    {"time": "04:00", "crashes": 1},
-    {"time": "08:00", "crashes": 4},
-    {"time": "12:00", "crashes": 3},
-    {"time": "16:00", "crashes": 7},
-    {"time": "20:00", "crashes": 5},
-    {"time": "23:59", "crashes": 2},
-]
+@cache
+def get_crash_trend_data():
+    return {
+        "time":    TREND_TIMES,
+        "crashes": _column([2, 1, 4, 3, 7, 5, 2]),
+    }
+
 
 # CPU utilisation data points for the resource area chart.
-CPU_DATA = [
-    {"time": "00:00", "usage": 45}, {"time": "04:00", "usage": 38},
-    {"time": "08:00", "usage": 72}, {"time": "12:00", "usage": 65},
-    {"time": "16:00", "usage": 88}, {"time": "20:00", "usage": 76},
-    {"time": "23:59", "usage": 52},
-]
+@cache
+def get_cpu_data():
+    return {
+        "time":  TREND_TIMES,
+        "usage": _column([45, 38, 72, 65, 88, 76, 52]),
+    }
+
 
 # Memory utilisation data points for the resource area chart.
-MEMORY_DATA = [
-    {"time": "00:00", "usage": 62}, {"time": "04:00", "usage": 58},
-    {"time": "08:00", "usage": 75}, {"time": "12:00", "usage": 71},
-    {"time": "16:00", "usage": 85}, {"time": "20:00", "usage": 79},
-    {"time": "23:59", "usage": 68},
-]
+@cache
+def get_memory_data():
+    return {
+        "time":  TREND_TIMES,
+        "usage": _column([62, 58, 75, 71, 85, 79, 68]),
+    }
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -84,14 +131,16 @@ MEMORY_DATA = [
 
 # Real-time alert cards with severity levels.
 # Severity hierarchy: Critical > High > Medium > Low
-ALERTS = [
-    {"time": "14:20:47", "module": "AuthService",     "severity": "Critical", "msg": "OutOfMemoryException in module AuthService.dll"},
-    {"time": "14:18:32", "module": "DatabaseService",  "severity": "High",     "msg": "Connection timeout after 30s"},
-    {"time": "14:15:21", "module": "APIGateway",       "severity": "Medium",   "msg": "High latency detected: 2.3s average"},
-    {"time": "14:12:14", "module": "CacheService",     "severity": "Low",      "msg": "Cache miss rate: 23%"},
-    {"time": "14:08:05", "module": "PaymentService",   "severity": "High",     "msg": "Transaction rollback due to timeout"},
-    {"time": "14:02:33", "module": "UserService",      "severity": "Medium",   "msg": "Session expiry approaching for 45 users"},
-]
+@cache
+def get_alerts():
+    return [
+        {"time": "14:20:47", "module": "AuthService",     "severity": "Critical", "msg": "OutOfMemoryException in module AuthService.dll"},
+        {"time": "14:18:32", "module": "DatabaseService",  "severity": "High",     "msg": "Connection timeout after 30s"},
+        {"time": "14:15:21", "module": "APIGateway",       "severity": "Medium",   "msg": "High latency detected: 2.3s average"},
+        {"time": "14:12:14", "module": "CacheService",     "severity": "Low",      "msg": "Cache miss rate: 23%"},
+        {"time": "14:08:05", "module": "PaymentService",   "severity": "High",     "msg": "Transaction rollback due to timeout"},
+        {"time": "14:02:33", "module": "UserService",      "severity": "Medium",   "msg": "Session expiry approaching for 45 users"},
+    ]
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -100,48 +149,54 @@ ALERTS = [
 
 # Single crash incident — used in the Crash Details screen.
 # Contains metadata, a human-readable summary, and AI-generated root causes.
-CRASH_INCIDENT = {
-    "id": "CRS-2026-0147",
-    "date": "January 14, 2026 - 14:20:47 UTC",
-    "severity": "Critical",
-    "module": "Authentication Service",
-    "recovery": "3.2 seconds",
-    "impact": "247 users affected",
-    "summary": (
-        "The authentication service experienced an out-of-memory exception at 14:20:47 UTC. "
-        "The crash was triggered by excessive memory allocation during concurrent user authentication requests. "
-        "Thread pool exhaustion (67 active threads) contributed to the system instability. "
-        "The service automatically restarted and recovered after 3.2 seconds."
-    ),
-    # AI root-cause analysis results, ordered by confidence score (descending).
-    "root_causes": [
-        {"title": "Memory Leak in Session Management", "confidence": "94%"},
-        {"title": "Insufficient Thread Pool Configuration", "confidence": "87%"},
-        {"title": "Concurrent Request Spike", "confidence": "76%"},
-    ],
-}
+@cache
+def get_crash_incident():
+    return {
+        "id": "CRS-2026-0147",
+        "date": "January 14, 2026 - 14:20:47 UTC",
+        "severity": "Critical",
+        "module": "Authentication Service",
+        "recovery": "3.2 seconds",
+        "impact": "247 users affected",
+        "summary": (
+            "The authentication service experienced an out-of-memory exception at 14:20:47 UTC. "
+            "The crash was triggered by excessive memory allocation during concurrent user authentication requests. "
+            "Thread pool exhaustion (67 active threads) contributed to the system instability. "
+            "The service automatically restarted and recovered after 3.2 seconds."
+        ),
+        # AI root-cause analysis results, ordered by confidence score (descending).
+        "root_causes": [
+            {"title": "Memory Leak in Session Management", "confidence": "94%"},
+            {"title": "Insufficient Thread Pool Configuration", "confidence": "87%"},
+            {"title": "Concurrent Request Spike", "confidence": "76%"},
+        ],
+    }
+
 
 # Error-log entries shown in the Crash Details log viewer.
 # Level hierarchy: ERROR > WARN > INFO > DEBUG
-LOG_ENTRIES = [
-    {"level": "ERROR", "time": "14:20:47", "msg": "OutOfMemoryException in module AuthService.dll"},
-    {"level": "WARN",  "time": "14:20:45", "msg": "Memory threshold exceeded: 95%"},
-    {"level": "ERROR", "time": "14:20:43", "msg": "Failed to allocate memory for user session"},
-    {"level": "INFO",  "time": "14:20:40", "msg": "Attempting garbage collection"},
-    {"level": "WARN",  "time": "14:20:38", "msg": "High memory pressure detected"},
-    {"level": "ERROR", "time": "14:20:35", "msg": "Thread pool exhausted: 67 active threads"},
-]
+@cache
+def get_log_entries():
+    return [
+        {"level": "ERROR", "time": "14:20:47", "msg": "OutOfMemoryException in module AuthService.dll"},
+        {"level": "WARN",  "time": "14:20:45", "msg": "Memory threshold exceeded: 95%"},
+        {"level": "ERROR", "time": "14:20:43", "msg": "Failed to allocate memory for user session"},
+        {"level": "INFO",  "time": "14:20:40", "msg": "Attempting garbage collection"},
+        {"level": "WARN",  "time": "14:20:38", "msg": "High memory pressure detected"},
+        {"level": "ERROR", "time": "14:20:35", "msg": "Thread pool exhausted: 67 active threads"},
+    ]
+
 
 # Resource utilisation at the time of the crash — plotted as a multi-line chart.
-RESOURCE_METRICS = [
-    {"time": "14:15", "cpu": 45, "memory": 62, "threads": 24},
-    {"time": "14:16", "cpu": 58, "memory": 68, "threads": 28},
-    {"time": "14:17", "cpu": 72, "memory": 75, "threads": 32},
-    {"time": "14:18", "cpu": 88, "memory": 85, "threads": 45},
-    {"time": "14:19", "cpu": 95, "memory": 92, "threads": 58},
-    {"time": "14:20", "cpu": 98, "memory": 95, "threads": 67},  # ← crash point
-    {"time": "14:21", "cpu": 12, "memory": 35, "threads": 18},  # ← post-recovery
-]
+# Index 5 (14:20) is the crash point; index 6 (14:21) is post-recovery.
+@cache
+def get_resource_metrics():
+    return {
+        "time":    ("14:15", "14:16", "14:17", "14:18", "14:19", "14:20", "14:21"),
+        "cpu":     _column([45, 58, 72, 88, 95, 98, 12]),
+        "memory":  _column([62, 68, 75, 85, 92, 95, 35]),
+        "threads": _column([24, 28, 32, 45, 58, 67, 18]),
+    }
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -150,18 +205,20 @@ RESOURCE_METRICS = [
 
 # Paginated system log table data.
 # Each entry includes an optional error-type classification for filtering.
-FULL_LOGS = [
-    {"id": "1",  "time": "2026-01-14 14:20:47", "level": "ERROR", "module": "AuthService",         "type": "Memory",      "msg": "OutOfMemoryException: Unable to allocate memory"},
-    {"id": "2",  "time": "2026-01-14 14:20:45", "level": "WARN",  "module": "AuthService",         "type": "Memory",      "msg": "Memory threshold exceeded: 95%"},
-    {"id": "3",  "time": "2026-01-14 14:20:43", "level": "ERROR", "module": "AuthService",         "type": "Memory",      "msg": "Failed to allocate memory for user session"},
-    {"id": "4",  "time": "2026-01-14 14:18:32", "level": "ERROR", "module": "DatabaseService",     "type": "Network",     "msg": "Connection timeout after 30s"},
-    {"id": "5",  "time": "2026-01-14 14:15:21", "level": "WARN",  "module": "APIGateway",          "type": "Performance", "msg": "High latency detected: 2.3s average"},
-    {"id": "6",  "time": "2026-01-14 14:12:14", "level": "INFO",  "module": "CacheService",        "type": "",            "msg": "Cache miss rate: 23%"},
-    {"id": "7",  "time": "2026-01-14 14:08:05", "level": "ERROR", "module": "PaymentService",      "type": "Transaction", "msg": "Transaction rollback due to timeout"},
-    {"id": "8",  "time": "2026-01-14 14:05:47", "level": "DEBUG", "module": "LogService",          "type": "",            "msg": "Log rotation completed successfully"},
-    {"id": "9",  "time": "2026-01-14 14:02:33", "level": "WARN",  "module": "UserService",         "type": "Session",     "msg": "Session expiry approaching for 45 users"},
-    {"id": "10", "time": "2026-01-14 13:58:12", "level": "ERROR", "module": "NotificationService", "type": "Integration", "msg": "Failed to send push notification"},
-]
+@cache
+def get_full_logs():
+    return [
+        {"id": "1",  "time": "2026-01-14 14:20:47", "level": "ERROR", "module": "AuthService",         "type": "Memory",      "msg": "OutOfMemoryException: Unable to allocate memory"},
+        {"id": "2",  "time": "2026-01-14 14:20:45", "level": "WARN",  "module": "AuthService",         "type": "Memory",      "msg": "Memory threshold exceeded: 95%"},
+        {"id": "3",  "time": "2026-01-14 14:20:43", "level": "ERROR", "module": "AuthService",         "type": "Memory",      "msg": "Failed to allocate memory for user session"},
+        {"id": "4",  "time": "2026-01-14 14:18:32", "level": "ERROR", "module": "DatabaseService",     "type": "Network",     "msg": "Connection timeout after 30s"},
+        {"id": "5",  "time": "2026-01-14 14:15:21", "level": "WARN",  "module": "APIGateway",          "type": "Performance", "msg": "High latency detected: 2.3s average"},
+        {"id": "6",  "time": "2026-01-14 14:12:14", "level": "INFO",  "module": "CacheService",        "type": "",            "msg": "Cache miss rate: 23%"},
+        {"id": "7",  "time": "2026-01-14 14:08:05", "level": "ERROR", "module": "PaymentService",      "type": "Transaction", "msg": "Transaction rollback due to timeout"},
+        {"id": "8",  "time": "2026-01-14 14:05:47", "level": "DEBUG", "module": "LogService",          "type": "",            "msg": "Log rotation completed successfully"},
+        {"id": "9",  "time": "2026-01-14 14:02:33", "level": "WARN",  "module": "UserService",         "type": "Session",     "msg": "Session expiry approaching for 45 users"},
+        {"id": "10", "time": "2026-01-14 13:58:12", "level": "ERROR", "module": "NotificationService", "type": "Integration", "msg": "Failed to send push notification"},
+    ]
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -170,8 +227,39 @@ FULL_LOGS = [
 
 # Team members listed in Settings → User Management.
 # Roles: Admin (full access), Analyst (read + respond), Viewer (read-only).
-USERS = [
-    {"name": "Alex Davidson",  "email": "alex.davidson@company.com",  "role": "Admin"},
-    {"name": "Sarah Chen",     "email": "sarah.chen@company.com",     "role": "Analyst"},
-    {"name": "Mike Johnson",   "email": "mike.johnson@company.com",   "role": "Viewer"},
-]
+@cache
+def get_users():
+    return [
+        {"name": "Alex Davidson",  "email": "alex.davidson@company.com",  "role": "Admin"},
+        {"name": "Sarah Chen",     "email": "sarah.chen@company.com",     "role": "Analyst"},
+        {"name": "Mike Johnson",   "email": "mike.johnson@company.com",   "role": "Viewer"},
+    ]
+
+
+# ═══════════════════════════════════════════════════════════════
+#  LAZY MODULE ATTRIBUTES (PEP 562)
+# ═══════════════════════════════════════════════════════════════
+
+_LOADERS = {
+    "DASHBOARD_METRICS": get_dashboard_metrics,
+    "CRASH_TREND_DATA":  get_crash_trend_data,
+    "CPU_DATA":          get_cpu_data,
+    "MEMORY_DATA":       get_memory_data,
+    "ALERTS":            get_alerts,
+    "CRASH_INCIDENT":    get_crash_incident,
+    "LOG_ENTRIES":       get_log_entries,
+    "RESOURCE_METRICS":  get_resource_metrics,
+    "FULL_LOGS":         get_full_logs,
+    "USERS":             get_users,
+}
+
+
+def __getattr__(name):
+    loader = _LOADERS.get(name)
+    if loader is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return loader()
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LOADERS))
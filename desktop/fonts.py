@@ -0,0 +1,43 @@
+"""
+CrashSense — Font Factory
+===========================
+
+Shared ``customtkinter.CTkFont`` instances keyed by (size, weight, family).
+
+Every ``CTkFont`` wraps its own Tk named font, so building one per label
+allocates a Tk font resource each time even though the screens only use a
+handful of distinct configurations. ``get_font`` hands out one instance per
+configuration instead.
+
+Usage::
+
+    from desktop.fonts import get_font
+    ctk.CTkLabel(master, text="CPU", font=get_font(14, "bold"))
+
+The returned fonts are shared — never ``configure()`` one in place.
+"""
+
+from functools import lru_cache
+
+import customtkinter as ctk
+
+from desktop.theme import FONT_FAMILY
+
+
+@lru_cache(maxsize=64)
+def get_font(size: int, weight: str = "normal", family: str | None = FONT_FAMILY) -> ctk.CTkFont:
+    """
+    Retrieve (or create and cache) a ``CTkFont``.
+
+    Must be called once a Tk root exists, like ``CTkFont`` itself.
+
+    Args:
+        size:   Point size.
+        weight: ``"normal"`` or ``"bold"``.
+        family: Font family; defaults to the theme's ``FONT_FAMILY``.
+                ``None`` selects CustomTkinter's default family.
+
+    Returns:
+        The shared ``CTkFont`` for this configuration.
+    """
+    return ctk.CTkFont(family=family, size=size, weight=weight)
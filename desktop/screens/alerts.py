@@ -11,6 +11,8 @@ Features:
   - Graphical icons per alert type (matching prediction screen)
   - Summary header (total counts per severity)
   - Expandable detail rows per alert
+  - Cards built in batches of _CARD_BATCH; a "Show more" row adds the next
+    batch, so long alert lists don't create every card's widgets up front
   - Empty-state illustration when no alerts exist
 """
 
@@ -21,9 +23,11 @@ from datetime import datetime
 
 from desktop.theme import (
     BG_ROOT, BG_CARD, BG_CARD_INNER, ORANGE, RED, YELLOW, GREEN, BLUE,
-    TEXT_PRIMARY, TEXT_SECONDARY, TEXT_MUTED, BORDER, FONT_FAMILY,
+    TEXT_PRIMARY, TEXT_SECONDARY, TEXT_MUTED, BORDER,
 )
 from desktop.icons import get_icon
+from desktop.fonts import get_font
+from desktop.screens.base import PollingScreen
 
 _API_BASE   = "http://127.0.0.1:5000"
 _REFRESH_MS = 5000
@@ -62,8 +66,11 @@ _TYPE_ICON_NAMES = {
 # ── Filter tabs ─────────────────────────────────────────────────────
 _FILTERS = ["All", "Critical", "High", "Medium", "Low"]
 
+# Cards materialised per batch (initial render and each "Show more").
+_CARD_BATCH = 20
 
-class AlertsScreen(ctk.CTkFrame):
+
+class AlertsScreen(PollingScreen, ctk.CTkFrame):
     """
     Live alerts screen. Fetches process-monitor crash precursors and renders
     them with severity-coded cards, graphical icons, and filter tabs.
@@ -73,7 +80,9 @@ class AlertsScreen(ctk.CTkFrame):
         super().__init__(master, fg_color=BG_ROOT, **kwargs)
 
         self._all_alerts: list[dict] = []
+        self._filtered:   list[dict] = []
         self._active_filter = "All"
+        self._shown = _CARD_BATCH     # How many filtered cards are rendered
         self._update_id = None
         self._destroyed  = False
 
@@ -92,14 +101,14 @@ class AlertsScreen(ctk.CTkFrame):
 
         ctk.CTkLabel(
             header, text="Active Alerts",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=20, weight="bold"),
+            font=get_font(20, "bold"),
             text_color=TEXT_PRIMARY,
         ).pack(side="left")
 
         # Refresh indicator / last-updated time
         self._updated_lbl = ctk.CTkLabel(
             header, text="",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=10),
+            font=get_font(10),
             text_color=TEXT_MUTED,
         )
         self._updated_lbl.pack(side="right")
@@ -114,13 +123,13 @@ class AlertsScreen(ctk.CTkFrame):
             col.pack(side="left", expand=True, padx=10, pady=10)
             count_lbl = ctk.CTkLabel(
                 col, text="0",
-                font=ctk.CTkFont(family=FONT_FAMILY, size=22, weight="bold"),
+                font=get_font(22, "bold"),
                 text_color=color,
             )
             count_lbl.pack()
             ctk.CTkLabel(
                 col, text=sev,
-                font=ctk.CTkFont(family=FONT_FAMILY, size=10),
+                font=get_font(10),
                 text_color=TEXT_MUTED,
             ).pack()
             self._summary_labels[sev.lower()] = count_lbl
@@ -136,7 +145,7 @@ class AlertsScreen(ctk.CTkFrame):
                 fg_color=ORANGE if f == "All" else BG_CARD,
                 text_color=TEXT_PRIMARY if f == "All" else TEXT_MUTED,
                 hover_color="#2a2c36",
-                font=ctk.CTkFont(family=FONT_FAMILY, size=12),
+                font=get_font(12),
                 command=lambda val=f: self._set_filter(val),
             )
             btn.pack(side="left", padx=(0, 8))
@@ -149,8 +158,7 @@ class AlertsScreen(ctk.CTkFrame):
             scrollbar_button_hover_color="#2a2c36",
         )
         self._scroll.pack(fill="both", expand=True, padx=24, pady=12)
-        self._scroll.bind_all("<Button-4>", lambda e: self._scroll._parent_canvas.yview_scroll(-3, "units"))
-        self._scroll.bind_all("<Button-5>", lambda e: self._scroll._parent_canvas.yview_scroll( 3, "units"))
+        self._bind_wheel()
 
     # ────────────────────────────────────────────────────────────────
     #  Data Fetching
@@ -207,6 +215,7 @@ class AlertsScreen(ctk.CTkFrame):
 
     def _set_filter(self, val: str):
         self._active_filter = val
+        self._shown = _CARD_BATCH
         for name, btn in self._filter_btns.items():
             active = name == val
             btn.configure(
@@ -220,15 +229,38 @@ class AlertsScreen(ctk.CTkFrame):
         for child in self._scroll.winfo_children():
             child.destroy()
 
-        filtered = self._filter_alerts()
+        self._filtered = self._filter_alerts()
 
-        if not filtered:
+        if not self._filtered:
             self._render_empty_state()
             return
 
-        for alert in filtered:
+        # Refreshes keep however many cards the user has already expanded to.
+        self._append_cards(0, min(self._shown, len(self._filtered)))
+
+    def _append_cards(self, start: int, end: int):
+        """Render filtered cards [start, end) plus a "Show more" row if any remain."""
+        for alert in self._filtered[start:end]:
             self._make_alert_card(alert)
 
+        remaining = len(self._filtered) - end
+        if remaining > 0:
+            more_btn = ctk.CTkButton(
+                self._scroll,
+                text=f"Show {min(remaining, _CARD_BATCH)} more  ({remaining} hidden)",
+                height=36, corner_radius=10,
+                fg_color=BG_CARD, hover_color="#2a2c36", text_color=TEXT_SECONDARY,
+                font=get_font(12),
+            )
+            more_btn.configure(command=lambda: self._show_more(more_btn))
+            more_btn.pack(fill="x", pady=(5, 0))
+
+    def _show_more(self, more_btn):
+        more_btn.destroy()
+        start = self._shown
+        self._shown += _CARD_BATCH
+        self._append_cards(start, min(self._shown, len(self._filtered)))
+
     def _filter_alerts(self) -> list[dict]:
         if self._active_filter == "All":
             return self._all_alerts
@@ -258,29 +290,24 @@ class AlertsScreen(ctk.CTkFrame):
             accent = ctk.CTkFrame(card, width=4, fg_color=color, corner_radius=2)
             accent.place(x=0, y=8, relheight=0.84)
 
+            # One grid holds the whole card body — icon | content | metric —
+            # instead of nested content/right frames:
+            #   col 0: icon box (spans every row)
+            #   col 1: title row, detail line, meta row   (stretches)
+            #   col 2: metric value over type label       (right-aligned)
             inner = ctk.CTkFrame(card, fg_color="transparent")
             inner.pack(fill="x", padx=(14, 12), pady=12)
-
-            # ── Icon box ─────────────────────────────────────────────
-            icon_name = _TYPE_ICON_NAMES.get(alert.get("type", ""), "active_alerts")
-            icon_img  = get_icon(icon_name, size=28, color=color)
-            icon_box  = ctk.CTkFrame(inner, width=50, height=50, corner_radius=12, fg_color=BG_CARD_INNER)
-            icon_box.pack(side="left")
-            icon_box.pack_propagate(False)
-            ctk.CTkLabel(icon_box, image=icon_img, text="").pack(expand=True)
+            inner.grid_columnconfigure(1, weight=1)
 
             # ── Main content ─────────────────────────────────────────
-            content = ctk.CTkFrame(inner, fg_color="transparent")
-            content.pack(side="left", fill="x", expand=True, padx=14)
-
             # Title row: name + severity badge + PID
-            title_row = ctk.CTkFrame(content, fg_color="transparent")
-            title_row.pack(fill="x")
+            title_row = ctk.CTkFrame(inner, fg_color="transparent")
+            title_row.grid(row=0, column=1, sticky="ew", padx=14)
 
             title = alert.get("title", alert.get("type", "?").replace("_", " ").title())
             ctk.CTkLabel(
                 title_row, text=title,
-                font=ctk.CTkFont(family=FONT_FAMILY, size=13, weight="bold"),
+                font=get_font(13, "bold"),
                 text_color=color,
             ).pack(side="left")
 
@@ -288,7 +315,7 @@ class AlertsScreen(ctk.CTkFrame):
             badge = ctk.CTkLabel(
                 title_row,
                 text=f"  {sev.upper()}  ",
-                font=ctk.CTkFont(family=FONT_FAMILY, size=9, weight="bold"),
+                font=get_font(9, "bold"),
                 text_color=color, fg_color=border, corner_radius=6, height=18,
             )
             badge.pack(side="left", padx=(8, 0))
@@ -299,63 +326,72 @@ class AlertsScreen(ctk.CTkFrame):
             ctk.CTkLabel(
                 title_row,
                 text=f"   {name}  (PID {pid})",
-                font=ctk.CTkFont(family=FONT_FAMILY, size=11),
+                font=get_font(11),
                 text_color=TEXT_MUTED,
             ).pack(side="left", padx=(8, 0))
+            rows = 1
 
             # Detail line
             detail = alert.get("detail", "")
             if detail:
                 ctk.CTkLabel(
-                    content, text=detail,
-                    font=ctk.CTkFont(family=FONT_FAMILY, size=11),
+                    inner, text=detail,
+                    font=get_font(11),
                     text_color=TEXT_SECONDARY, anchor="w",
-                ).pack(fill="x", pady=(4, 0))
-
-            # Bottom row: metric chip + detected time
-            meta_row = ctk.CTkFrame(content, fg_color="transparent")
-            meta_row.pack(fill="x", pady=(6, 0))
-
-            metric = alert.get("metric", "")
-            if metric:
-                chip = ctk.CTkLabel(
-                    meta_row,
-                    text=f"  {metric}  ",
-                    font=ctk.CTkFont(family=FONT_FAMILY, size=10, weight="bold"),
-                    text_color=color, fg_color=BG_CARD_INNER, corner_radius=6, height=22,
-                )
-                chip.pack(side="left")
+                ).grid(row=rows, column=1, sticky="ew", padx=14, pady=(4, 0))
+                rows += 1
 
+            # Bottom row: metric chip + detected time (skipped when both empty)
+            metric   = alert.get("metric", "")
             time_str = alert.get("time_str", "")
-            if time_str:
-                ctk.CTkLabel(
-                    meta_row, text=f"Detected {time_str}",
-                    font=ctk.CTkFont(family=FONT_FAMILY, size=10),
-                    text_color=TEXT_MUTED,
-                ).pack(side="left", padx=(10, 0))
+            if metric or time_str:
+                meta_row = ctk.CTkFrame(inner, fg_color="transparent")
+                meta_row.grid(row=rows, column=1, sticky="ew", padx=14, pady=(6, 0))
+                rows += 1
+
+                if metric:
+                    chip = ctk.CTkLabel(
+                        meta_row,
+                        text=f"  {metric}  ",
+                        font=get_font(10, "bold"),
+                        text_color=color, fg_color=BG_CARD_INNER, corner_radius=6, height=22,
+                    )
+                    chip.pack(side="left")
+
+                if time_str:
+                    ctk.CTkLabel(
+                        meta_row, text=f"Detected {time_str}",
+                        font=get_font(10),
+                        text_color=TEXT_MUTED,
+                    ).pack(side="left", padx=(10, 0))
 
-            # ── Right: metric value (large) ──────────────────────────
-            right = ctk.CTkFrame(inner, fg_color="transparent")
-            right.pack(side="right", padx=(8, 0))
+            # ── Icon box ─────────────────────────────────────────────
+            icon_name = _TYPE_ICON_NAMES.get(alert.get("type", ""), "active_alerts")
+            icon_img  = get_icon(icon_name, size=28, color=color)
+            icon_box  = ctk.CTkFrame(inner, width=50, height=50, corner_radius=12, fg_color=BG_CARD_INNER)
+            icon_box.grid(row=0, column=0, rowspan=rows)
+            icon_box.pack_propagate(False)
+            ctk.CTkLabel(icon_box, image=icon_img, text="").pack(expand=True)
 
+            # ── Right: metric value (large) ──────────────────────────
             type_label = alert.get("type", "").replace("_", " ").upper()
             if metric:
                 ctk.CTkLabel(
-                    right, text=metric,
-                    font=ctk.CTkFont(family=FONT_FAMILY, size=14, weight="bold"),
+                    inner, text=metric,
+                    font=get_font(14, "bold"),
                     text_color=TEXT_PRIMARY,
-                ).pack(anchor="e")
+                ).grid(row=0, column=2, sticky="e", padx=(8, 0))
             ctk.CTkLabel(
-                right, text=type_label,
-                font=ctk.CTkFont(family=FONT_FAMILY, size=9),
+                inner, text=type_label,
+                font=get_font(9),
                 text_color=TEXT_MUTED,
-            ).pack(anchor="e")
+            ).grid(row=1 if metric else 0, column=2, sticky="ne", padx=(8, 0))
 
         except Exception as exc:
             ctk.CTkLabel(
                 card,
                 text=f"  Alert rendering error: {exc}",
-                font=ctk.CTkFont(size=10),
+                font=get_font(10, family=None),
                 text_color=TEXT_MUTED,
             ).pack(pady=8, padx=12, anchor="w")
 
@@ -369,14 +405,14 @@ class AlertsScreen(ctk.CTkFrame):
         ctk.CTkLabel(
             frame,
             text="No alerts" if self._active_filter == "All" else f"No {self._active_filter} alerts",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=15, weight="bold"),
+            font=get_font(15, "bold"),
             text_color=GREEN,
         ).pack(pady=(12, 4))
         ctk.CTkLabel(
             frame,
             text="All monitored processes are behaving normally." if self._active_filter == "All"
                  else f"No {self._active_filter.lower()}-severity issues detected.",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=12),
+            font=get_font(12),
             text_color=TEXT_MUTED,
         ).pack()
 
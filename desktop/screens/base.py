@@ -0,0 +1,64 @@
+"""
+CrashSense — Cached Screen Hooks
+=================================
+
+`CrashSenseApp._navigate` keeps each main screen alive after its first
+visit, calling `on_hide()` when it is hidden and `on_show()` when it is
+shown again. The mixins here implement those hooks once for every screen.
+
+A screen sets `self._scroll` (the scroll frame that takes the mouse wheel)
+and overrides `_pause()` / `_resume()` for its own timers or reloads.
+Screens refreshed by a single `after()` timer held in `self._update_id`
+use `PollingScreen`, which cancels that timer on hide and refreshes
+straight away on show.
+
+Usage::
+
+    class LogsScreen(PollingScreen, ctk.CTkFrame):
+        ...
+"""
+
+from desktop.wheel import bind_wheel
+
+
+class CachedScreen:
+    """Mixin providing `on_show()` / `on_hide()` for screens cached by the app."""
+
+    def on_hide(self):
+        """Pause background work while the screen is not displayed."""
+        self._pause()
+
+    def on_show(self):
+        """Re-claim the mouse wheel and resume."""
+        self._bind_wheel()
+        self._resume()
+
+    def _bind_wheel(self):
+        """Route mouse-wheel scrolling to this screen's scroll frame."""
+        bind_wheel(self, self._scroll)
+
+    def _pause(self):
+        pass
+
+    def _resume(self):
+        pass
+
+
+class PollingScreen(CachedScreen):
+    """`CachedScreen` for screens refreshed by the `after()` timer in `_update_id`."""
+
+    _update_id = None
+
+    def _pause(self):
+        """Cancel the pending refresh."""
+        if self._update_id is not None:
+            self.after_cancel(self._update_id)
+            self._update_id = None
+
+    def _resume(self):
+        """Refresh immediately unless a refresh is already pending."""
+        if self._update_id is None:
+            self._refresh_now()
+
+    def _refresh_now(self):
+        self._schedule_refresh()
@@ -21,19 +21,27 @@ Data sources:
 """
 
 import threading
+import tkinter as tk
 import customtkinter as ctk
 import requests
+import numpy as np
 import matplotlib
 matplotlib.use("Agg")
 from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from datetime import datetime
 
 from desktop.theme import (
     BG_ROOT, BG_CARD, BG_CARD_INNER, ORANGE, RED, RED_BG, YELLOW, YELLOW_BG,
-    BLUE, BLUE_BG, GREEN, TEXT_PRIMARY, TEXT_SECONDARY, TEXT_MUTED, BORDER, FONT_FAMILY,
+    BLUE, BLUE_BG, GREEN, TEXT_PRIMARY, TEXT_SECONDARY, TEXT_MUTED, BORDER,
+    SEVERITY_RANK,
+    CHART_RC,
 )
 from desktop.icons import get_icon
+from desktop.fonts import get_font
+from desktop.widgets import card_frame, transparent_frame
+from desktop.screens.base import PollingScreen
 
 _API_BASE   = "http://127.0.0.1:5000"
 _REFRESH_MS = 7000
@@ -107,7 +115,91 @@ _ROOT_CAUSES = {
 }
 
 
-class CrashDetailsScreen(ctk.CTkFrame):
+# ── Chart figure (built off the Tk thread) ────────────────────────
+
+def _history_figure(history: list[dict], accent_color: str) -> Figure:
+    """
+    Build and lay out the resource-metrics Figure for a process history.
+
+    Touches no Tk state, so it runs on the history fetch thread; the Tk
+    thread only wraps the finished Figure in a FigureCanvasTkAgg. The Figure
+    is not shared with any other thread until it is handed over.
+    """
+    # ── Extract series ───────────────────────────────────────
+    # One pass over the history dicts into a (n, 4) float64 block;
+    # the columns are then handed to Matplotlib as arrays. (float64:
+    # epoch timestamps need more precision than float32 offers.)
+    cols = np.array(
+        [(h["timestamp"], h["cpu_percent"], h["rss_mb"], h["num_threads"])
+         for h in history],
+        dtype=np.float64,
+    )
+
+    # Need at least 2 points to draw a line — duplicate the single point if needed
+    if len(cols) == 1:
+        cols = np.vstack([cols, cols + (3, 0, 0, 0)])
+    ts, cpu, mem, thrd = cols.T
+
+    # X axis: elapsed seconds
+    xs = ts - ts[0]
+
+    # ── Build figure ─────────────────────────────────────────
+    with matplotlib.rc_context(CHART_RC):
+        fig = Figure(figsize=(8, 3.2), dpi=100)
+        FigureCanvasAgg(fig)      # Offscreen canvas; replaced when attached to Tk
+
+        # Dual Y-axis: CPU% + Threads (left)  |  RSS MB (right, different scale)
+        ax1 = fig.add_subplot(111)
+        ax2 = ax1.twinx()
+
+        # CPU % — primary left
+        ax1.plot(xs, cpu, color=ORANGE, linewidth=2, label="CPU %", zorder=3)
+        ax1.fill_between(xs, cpu, alpha=0.12, color=ORANGE)
+
+        # Thread count — also left axis
+        ax1.plot(xs, thrd, color="#fbbf24", linewidth=1.5,
+                 label="Threads", linestyle=":", zorder=2)
+
+        # RSS MB — secondary right axis
+        ax2.plot(xs, mem, color=accent_color, linewidth=2,
+                 label="RSS MB", linestyle="--", zorder=2)
+        ax2.fill_between(xs, mem, alpha=0.08, color=accent_color)
+        ax2.set_ylabel("RSS MB", fontsize=8)
+        ax2.tick_params(labelsize=7)
+
+        # X-axis: show real clock times, spaced sensibly
+        n    = len(xs)
+        step = max(1, n // 6)
+        ticks = list(range(0, n, step))
+        ax1.set_xticks(xs[ticks])
+        # Clock labels are formatted only for the ticks actually shown.
+        ax1.set_xticklabels([datetime.fromtimestamp(ts[i]).strftime("%H:%M:%S") for i in ticks],
+                             rotation=20, ha="right", fontsize=7)
+
+        ax1.set_ylabel("CPU % / Threads", fontsize=8)
+        ax1.tick_params(labelsize=7)
+
+        # Combined legend
+        l1, lb1 = ax1.get_legend_handles_labels()
+        l2, lb2 = ax2.get_legend_handles_labels()
+        ax1.legend(l1 + l2, lb1 + lb2,
+                   facecolor=BG_CARD, edgecolor=BORDER,
+                   labelcolor=TEXT_SECONDARY, fontsize=8, loc="upper left")
+
+        ax1.grid(True, color="#1e1e2a", linewidth=0.5, alpha=0.5)
+        fig.tight_layout(pad=1.5)
+        fig.subplots_adjust(bottom=0.25)
+        return fig
+
+
+def _release_figure(fig: Figure | None):
+    """Clear `fig` so its artists are freed without waiting for the GC."""
+    if fig is not None:
+        try: fig.clf()
+        except Exception: pass
+
+
+class CrashDetailsScreen(PollingScreen, ctk.CTkFrame):
     """
     Live Crash Details screen.
     Keeps the same original visual structure but driven by real backend data.
@@ -121,7 +213,8 @@ class CrashDetailsScreen(ctk.CTkFrame):
         self._update_id  = None
         self._destroyed  = False
         self._chart_fig  = None
-        self._icon_refs  = []
+        self._pending_fig = None          # Prepared Figure awaiting _build_chart
+        self._build_ids: list[str] = []   # Pending after() ids of deferred card builds
 
         self.bind("<Destroy>", self._on_destroy)
         self._build_skeleton()
@@ -135,12 +228,12 @@ class CrashDetailsScreen(ctk.CTkFrame):
         # ── Selector bar ──────────────────────────────────────────
         top = ctk.CTkFrame(self, fg_color=BG_CARD, corner_radius=0)
         top.pack(fill="x")
-        inner_top = ctk.CTkFrame(top, fg_color="transparent")
+        inner_top = transparent_frame(top)
         inner_top.pack(fill="x", padx=24, pady=10)
 
         ctk.CTkLabel(
             inner_top, text="Viewing Alert:",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=12),
+            font=get_font(12),
             text_color=TEXT_MUTED,
         ).pack(side="left")
 
@@ -152,13 +245,13 @@ class CrashDetailsScreen(ctk.CTkFrame):
             fg_color=BG_CARD_INNER, button_color=BG_CARD_INNER,
             button_hover_color="#2a2c36", dropdown_fg_color=BG_CARD,
             text_color=TEXT_PRIMARY,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=12),
+            font=get_font(12),
         )
         self._selector.pack(side="left", padx=(10, 0))
 
         self._updated_lbl = ctk.CTkLabel(
             inner_top, text="",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=10),
+            font=get_font(10),
             text_color=TEXT_MUTED,
         )
         self._updated_lbl.pack(side="right")
@@ -170,8 +263,7 @@ class CrashDetailsScreen(ctk.CTkFrame):
             scrollbar_button_hover_color="#2a2c36",
         )
         self._scroll.pack(fill="both", expand=True)
-        self._scroll.bind_all("<Button-4>", lambda e: self._scroll._parent_canvas.yview_scroll(-3, "units"))
-        self._scroll.bind_all("<Button-5>", lambda e: self._scroll._parent_canvas.yview_scroll( 3, "units"))
+        self._bind_wheel()
 
         self._render_empty()
 
@@ -208,8 +300,7 @@ class CrashDetailsScreen(ctk.CTkFrame):
         if self._destroyed:
             return
 
-        sev_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-        self._alerts = sorted(alerts, key=lambda a: sev_order.get(a.get("severity", "low"), 3))
+        self._alerts = sorted(alerts, key=lambda a: SEVERITY_RANK.get(a.get("severity", "low"), 3))
 
         self._updated_lbl.configure(text=f"Updated {datetime.now().strftime('%H:%M:%S')}")
 
@@ -252,28 +343,83 @@ class CrashDetailsScreen(ctk.CTkFrame):
                 resp = requests.get(f"{_API_BASE}/api/process-history/{pid}", timeout=3)
                 if resp.status_code == 200 and not self._destroyed:
                     data = resp.json()
-                    self.after(0, lambda: self._render_detail(alert, data))
+                    fig, error = self._prepare_chart(alert, data.get("history", []))
+                    self.after(0, lambda: self._render_detail(alert, data, fig, error))
             except Exception:
                 pass
         threading.Thread(target=_fetch, daemon=True).start()
 
+    @staticmethod
+    def _prepare_chart(alert: dict, history: list[dict]):
+        """
+        Build the chart Figure on the calling (fetch) thread.
+
+        Returns `(fig, error_text)`: the Figure and None on success, or None
+        and the plotting error to show in place of the chart. Both are None
+        for an empty history.
+        """
+        if not history:
+            return None, None
+        try:
+            return _history_figure(history, _SEV_COLORS.get(alert.get("severity", "low"), BLUE)), None
+        except Exception as exc:
+            return None, str(exc)
+
     # ────────────────────────────────────────────────────────────────
     #  Full-page Detail Render
     # ────────────────────────────────────────────────────────────────
 
-    def _render_detail(self, alert: dict, history_data: dict):
+    def _render_detail(self, alert: dict, history_data: dict, fig=None, error=None):
+        """
+        Rebuild the detail page for `alert`.
+
+        The header and summary cards are built synchronously so the page
+        paints straight away. The root-cause, log and chart cards are packed
+        empty here, to fix their order, and filled in once Tk is idle; the
+        chart (`fig` / `error`, from `_prepare_chart`) is attached last.
+        """
         if self._destroyed:
+            _release_figure(fig)
             return
 
-        if self._chart_fig:
-            try: self._chart_fig.clf()
-            except Exception: pass
-            self._chart_fig = None
+        self._cancel_builds()
+        _release_figure(self._chart_fig)
+        self._chart_fig = None
 
         for w in self._scroll.winfo_children():
             w.destroy()
-        self._icon_refs.clear()
 
+        history = history_data.get("history", [])
+
+        self._build_header(alert)
+        self._build_summary(alert)
+
+        ai_card = card_frame(self._scroll, fg_color="#1a1208", border_color="#3d2a0a")
+        ai_card.pack(fill="x", padx=24, pady=(12, 0))
+        log_card = card_frame(self._scroll)
+        log_card.pack(fill="x", padx=24, pady=(12, 0))
+        chart_card = card_frame(self._scroll)
+        chart_card.pack(fill="x", padx=24, pady=(12, 24))
+
+        self._build_ids = [
+            self.after_idle(self._build_root_causes, ai_card, alert),
+            self.after_idle(self._build_logs, log_card, alert, history),
+            self.after(50, self._build_chart, chart_card, history, error),
+        ]
+        self._pending_fig = fig
+
+    def _cancel_builds(self):
+        """Drop deferred card builds whose target cards are about to go."""
+        for build_id in self._build_ids:
+            self.after_cancel(build_id)
+        self._build_ids = []
+        # A cancelled _build_chart never attaches its Figure; free it here.
+        _release_figure(self._pending_fig)
+        self._pending_fig = None
+
+    # ── 1. Incident Header ────────────────────────────────────────
+
+    def _build_header(self, alert: dict):
         sev    = alert.get("severity", "low")
         color  = _SEV_COLORS.get(sev, BLUE)
         border = _SEV_BORDER.get(sev, BORDER)
@@ -283,50 +429,47 @@ class CrashDetailsScreen(ctk.CTkFrame):
         pid      = alert.get("pid",    "?")
         atype    = alert.get("type",   "")
         title    = alert.get("title",  _TYPE_HUMAN.get(atype, "Crash Precursor"))
-        detail   = alert.get("detail", "No details available.")
         metric   = alert.get("metric", "")
         time_str = alert.get("time_str", datetime.now().strftime("%H:%M:%S"))
         detected = datetime.now().strftime("%d %b %Y, %H:%M")
 
-        # ── 1. Incident Header ────────────────────────────────────
-        header_card = ctk.CTkFrame(self._scroll, fg_color=BG_CARD, corner_radius=16, border_width=1, border_color=BORDER)
+        header_card = card_frame(self._scroll)
         header_card.pack(fill="x", padx=24, pady=(16, 0))
-        hi = ctk.CTkFrame(header_card, fg_color="transparent")
+        hi = transparent_frame(header_card)
         hi.pack(fill="x", padx=20, pady=16)
 
-        top = ctk.CTkFrame(hi, fg_color="transparent")
+        top = transparent_frame(hi)
         top.pack(fill="x")
 
         icon_img = get_icon(_TYPE_ICON.get(atype, "active_alerts"), size=22, color=color)
-        self._icon_refs.append(icon_img)
         icon_box = ctk.CTkFrame(top, width=48, height=48, corner_radius=12, fg_color=icon_bg)
         icon_box.pack(side="left")
         icon_box.pack_propagate(False)
         ctk.CTkLabel(icon_box, image=icon_img, text="").pack(expand=True)
 
-        txt = ctk.CTkFrame(top, fg_color="transparent")
+        txt = transparent_frame(top)
         txt.pack(side="left", padx=(12, 0))
         ctk.CTkLabel(
             txt, text=title,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=16, weight="bold"),
+            font=get_font(16, "bold"),
             text_color=TEXT_PRIMARY,
         ).pack(anchor="w")
         ctk.CTkLabel(
             txt, text=f"Detected at {time_str}  •  {detected}",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=11),
+            font=get_font(11),
             text_color=TEXT_SECONDARY,
         ).pack(anchor="w")
 
         badge = ctk.CTkLabel(
             top, text=f"  {sev.upper()}  ",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=12, weight="bold"),
+            font=get_font(12, "bold"),
             text_color=color, fg_color=border, corner_radius=8, height=30,
         )
         badge.pack(side="right")
 
         ctk.CTkFrame(hi, height=1, fg_color=BORDER).pack(fill="x", pady=(12, 10))
 
-        info_row = ctk.CTkFrame(hi, fg_color="transparent")
+        info_row = transparent_frame(hi)
         info_row.pack(fill="x")
         for i in range(3):
             info_row.columnconfigure(i, weight=1)
@@ -337,39 +480,47 @@ class CrashDetailsScreen(ctk.CTkFrame):
             ("Key Metric",     metric if metric else "N/A"),
         ]
         for col, (label, val) in enumerate(meta):
-            f = ctk.CTkFrame(info_row, fg_color="transparent")
+            f = transparent_frame(info_row)
             f.grid(row=0, column=col, sticky="w", padx=4)
-            ctk.CTkLabel(f, text=label, font=ctk.CTkFont(family=FONT_FAMILY, size=11), text_color=TEXT_SECONDARY).pack(anchor="w")
-            ctk.CTkLabel(f, text=val,   font=ctk.CTkFont(family=FONT_FAMILY, size=13, weight="bold"), text_color=TEXT_PRIMARY).pack(anchor="w")
+            ctk.CTkLabel(f, text=label, font=get_font(11), text_color=TEXT_SECONDARY).pack(anchor="w")
+            ctk.CTkLabel(f, text=val,   font=get_font(13, "bold"), text_color=TEXT_PRIMARY).pack(anchor="w")
 
-        # ── 2. Crash Summary ──────────────────────────────────────
-        sum_card = ctk.CTkFrame(self._scroll, fg_color=BG_CARD, corner_radius=16, border_width=1, border_color=BORDER)
+    # ── 2. Crash Summary ──────────────────────────────────────────
+
+    def _build_summary(self, alert: dict):
+        detail = alert.get("detail", "No details available.")
+
+        sum_card = card_frame(self._scroll)
         sum_card.pack(fill="x", padx=24, pady=(12, 0))
-        si = ctk.CTkFrame(sum_card, fg_color="transparent")
+        si = transparent_frame(sum_card)
         si.pack(fill="x", padx=20, pady=16)
 
-        h = ctk.CTkFrame(si, fg_color="transparent")
+        h = transparent_frame(si)
         h.pack(fill="x")
         info_icon = get_icon("info_circle", size=18, color=ORANGE)
-        self._icon_refs.append(info_icon)
         ctk.CTkLabel(h, image=info_icon, text="").pack(side="left")
-        ctk.CTkLabel(h, text="  Alert Summary", font=ctk.CTkFont(family=FONT_FAMILY, size=14, weight="bold"), text_color=TEXT_PRIMARY).pack(side="left")
+        ctk.CTkLabel(h, text="  Alert Summary", font=get_font(14, "bold"), text_color=TEXT_PRIMARY).pack(side="left")
 
         ctk.CTkLabel(
             si, text=detail,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=12),
+            font=get_font(12),
             text_color=TEXT_SECONDARY, wraplength=700, justify="left",
         ).pack(fill="x", pady=(8, 0))
 
-        # ── 3. AI Root Cause Analysis ─────────────────────────────
-        ai_card = ctk.CTkFrame(self._scroll, fg_color="#1a1208", corner_radius=16, border_width=1, border_color="#3d2a0a")
-        ai_card.pack(fill="x", padx=24, pady=(12, 0))
-        ai = ctk.CTkFrame(ai_card, fg_color="transparent")
+    # ── 3. AI Root Cause Analysis (deferred) ──────────────────────
+
+    def _build_root_causes(self, ai_card, alert: dict):
+        sev    = alert.get("severity", "low")
+        atype  = alert.get("type",   "")
+        title  = alert.get("title",  _TYPE_HUMAN.get(atype, "Crash Precursor"))
+        detail = alert.get("detail", "No details available.")
+
+        ai = transparent_frame(ai_card)
         ai.pack(fill="x", padx=20, pady=16)
 
         ctk.CTkLabel(
             ai, text="AI-Based Root Cause Analysis",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=14, weight="bold"),
+            font=get_font(14, "bold"),
             text_color=TEXT_PRIMARY,
         ).pack(anchor="w", pady=(0, 8))
 
@@ -379,38 +530,36 @@ class CrashDetailsScreen(ctk.CTkFrame):
         ])
 
         for i, (rc_title, rc_detail) in enumerate(root_causes, 1):
-            row = ctk.CTkFrame(ai, fg_color="transparent")
+            row = transparent_frame(ai)
             row.pack(fill="x", pady=4)
 
             num = ctk.CTkFrame(row, width=28, height=28, corner_radius=14, fg_color=ORANGE)
             num.pack(side="left", anchor="n", pady=2)
             num.pack_propagate(False)
-            ctk.CTkLabel(num, text=str(i), font=ctk.CTkFont(family=FONT_FAMILY, size=11, weight="bold"), text_color="#ffffff").pack(expand=True)
+            ctk.CTkLabel(num, text=str(i), font=get_font(11, "bold"), text_color="#ffffff").pack(expand=True)
 
-            t = ctk.CTkFrame(row, fg_color="transparent")
+            t = transparent_frame(row)
             t.pack(side="left", padx=(10, 0), fill="x", expand=True)
-            ctk.CTkLabel(t, text=rc_title, font=ctk.CTkFont(family=FONT_FAMILY, size=13, weight="bold"), text_color=TEXT_PRIMARY, anchor="w").pack(fill="x")
-            ctk.CTkLabel(t, text=rc_detail, font=ctk.CTkFont(family=FONT_FAMILY, size=11), text_color=TEXT_SECONDARY, wraplength=620, justify="left", anchor="w").pack(fill="x")
+            ctk.CTkLabel(t, text=rc_title, font=get_font(13, "bold"), text_color=TEXT_PRIMARY, anchor="w").pack(fill="x")
+            ctk.CTkLabel(t, text=rc_detail, font=get_font(11), text_color=TEXT_SECONDARY, wraplength=620, justify="left", anchor="w").pack(fill="x")
 
-        # ── 4. Process Activity Log ───────────────────────────────
-        log_card = ctk.CTkFrame(self._scroll, fg_color=BG_CARD, corner_radius=16, border_width=1, border_color=BORDER)
-        log_card.pack(fill="x", padx=24, pady=(12, 0))
-        li = ctk.CTkFrame(log_card, fg_color="transparent")
+    # ── 4. Process Activity Log (deferred) ────────────────────────
+
+    def _build_logs(self, log_card, alert: dict, history: list[dict]):
+        li = transparent_frame(log_card)
         li.pack(fill="x", padx=20, pady=16)
 
-        log_hdr = ctk.CTkFrame(li, fg_color="transparent")
+        log_hdr = transparent_frame(li)
         log_hdr.pack(fill="x")
         logs_icon = get_icon("logs", size=18, color=ORANGE)
-        self._icon_refs.append(logs_icon)
         ctk.CTkLabel(log_hdr, image=logs_icon, text="").pack(side="left")
-        ctk.CTkLabel(log_hdr, text="  Process Activity Log", font=ctk.CTkFont(family=FONT_FAMILY, size=14, weight="bold"), text_color=TEXT_PRIMARY).pack(side="left")
+        ctk.CTkLabel(log_hdr, text="  Process Activity Log", font=get_font(14, "bold"), text_color=TEXT_PRIMARY).pack(side="left")
 
         log_box = ctk.CTkFrame(li, fg_color=BG_CARD_INNER, corner_radius=10)
         log_box.pack(fill="x", pady=(8, 0))
 
         # Build log lines from snapshot history
-        history = history_data.get("history", [])
-        log_entries = self._build_log_entries(alert, history)
+        log_entries = self._build_log_entries(alert, history)[-15:]   # Show last 15 entries
 
         level_colors = {
             "CRIT": (RED,    RED_BG),
@@ -419,27 +568,49 @@ class CrashDetailsScreen(ctk.CTkFrame):
             "OK":   (GREEN,  "#0a2a0a"),
         }
 
-        for entry in log_entries[-15:]:   # Show last 15 entries
-            row = ctk.CTkFrame(log_box, fg_color="transparent")
-            row.pack(fill="x", padx=12, pady=3)
-
-            ctk.CTkLabel(row, text=entry["time"], font=ctk.CTkFont(family="Courier", size=11), text_color=TEXT_MUTED, width=70).pack(side="left")
-
-            lc, lb = level_colors.get(entry["level"], (TEXT_MUTED, BG_CARD_INNER))
-            ctk.CTkLabel(row, text=f" {entry['level']} ", font=ctk.CTkFont(family=FONT_FAMILY, size=10, weight="bold"), text_color=lc, fg_color=lb, corner_radius=4, width=50).pack(side="left", padx=(8, 8))
-
-            ctk.CTkLabel(row, text=entry["msg"], font=ctk.CTkFont(family=FONT_FAMILY, size=11), text_color=TEXT_SECONDARY, anchor="w").pack(side="left", fill="x", expand=True)
-
-        # ── 5. Resource Metrics Chart ─────────────────────────────
-        chart_card = ctk.CTkFrame(self._scroll, fg_color=BG_CARD, corner_radius=16, border_width=1, border_color=BORDER)
-        chart_card.pack(fill="x", padx=24, pady=(12, 24))
+        # One read-only Text widget with a tag per column/level instead of a
+        # frame and three labels per row. A plain tk widget gets no
+        # CustomTkinter scaling, so fonts and pixel offsets are scaled here.
+        scaling = ctk.ScalingTracker.get_widget_scaling(log_box)
+        px = lambda n: round(n * scaling)
+        txt = tk.Text(
+            log_box, bg=BG_CARD_INNER, fg=TEXT_SECONDARY, bd=0, highlightthickness=0,
+            wrap="none", cursor="arrow", height=max(1, len(log_entries)),
+            font=get_font(11).create_scaled_tuple(scaling),
+            padx=px(12), pady=px(6), spacing1=px(3), spacing3=px(3),
+            # Level badge centred in the old 50 px column; message after it
+            tabs=(px(103), "center", px(136), "left"),
+        )
+        txt.pack(fill="x", padx=px(2), pady=px(4))
+
+        txt.tag_config("TIME", foreground=TEXT_MUTED,
+                       font=get_font(11, family="Courier").create_scaled_tuple(scaling))
+        badge_font = get_font(10, "bold").create_scaled_tuple(scaling)
+        for level, (lc, lb) in level_colors.items():
+            txt.tag_config(level, foreground=lc, background=lb, font=badge_font)
+        txt.tag_config("LEVEL", foreground=TEXT_MUTED, font=badge_font)   # Unknown levels
+
+        for i, entry in enumerate(log_entries):
+            level = entry["level"]
+            txt.insert(
+                "end",
+                entry["time"], "TIME", "\t", (),
+                f" {level} ", level if level in level_colors else "LEVEL",
+                f"\t{entry['msg']}" + ("\n" if i < len(log_entries) - 1 else ""), (),
+            )
+        txt.configure(state="disabled")
+
+    # ── 5. Resource Metrics Chart (deferred) ──────────────────────
+
+    def _build_chart(self, chart_card, history: list[dict], error):
         ctk.CTkLabel(
             chart_card, text="Resource Metrics at Time of Alert",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=14, weight="bold"),
+            font=get_font(14, "bold"),
             text_color=TEXT_PRIMARY,
         ).pack(anchor="w", padx=20, pady=(16, 0))
 
-        self._render_chart(chart_card, history, color)
+        fig, self._pending_fig = self._pending_fig, None
+        self._render_chart(chart_card, history, fig, error)
 
     # ────────────────────────────────────────────────────────────────
     #  Log Entry Builder
@@ -492,115 +663,51 @@ class CrashDetailsScreen(ctk.CTkFrame):
     #  Resource Chart
     # ────────────────────────────────────────────────────────────────
 
-    def _render_chart(self, parent, history: list[dict], accent_color: str):
+    def _render_chart(self, parent, history: list[dict], fig, error):
+        """Attach the prepared `fig` (or show `error`, or why there is none)."""
         # If no data at all, show a helpful message
         if not history:
             ctk.CTkLabel(
                 parent,
                 text="History accumulates after the first few scan cycles (~15 s).\n"
                      "Leave the app running and revisit this screen.",
-                font=ctk.CTkFont(family=FONT_FAMILY, size=11),
+                font=get_font(11),
                 text_color=TEXT_MUTED, justify="center",
             ).pack(pady=20, padx=20)
             return
 
-        try:
-            # ── Extract series ───────────────────────────────────────
-            ts   = [h["timestamp"]   for h in history]
-            cpu  = [h["cpu_percent"] for h in history]
-            mem  = [h["rss_mb"]      for h in history]
-            thrd = [h["num_threads"] for h in history]
-
-            # Need at least 2 points to draw a line — duplicate the single point if needed
-            if len(ts) == 1:
-                ts   = [ts[0],   ts[0]   + 3]
-                cpu  = [cpu[0],  cpu[0]]
-                mem  = [mem[0],  mem[0]]
-                thrd = [thrd[0], thrd[0]]
-
-            # X axis: elapsed seconds
-            t0 = ts[0]
-            xs = [(t - t0) for t in ts]
-            x_labels = [datetime.fromtimestamp(t).strftime("%H:%M:%S") for t in ts]
-
-            # ── Build figure ─────────────────────────────────────────
-            fig = Figure(figsize=(8, 3.2), dpi=100)
-            fig.patch.set_facecolor(BG_CARD)
-            self._chart_fig = fig
-
-            # Dual Y-axis: CPU% + Threads (left)  |  RSS MB (right, different scale)
-            ax1 = fig.add_subplot(111)
-            ax1.set_facecolor(BG_CARD)
-            ax2 = ax1.twinx()
-
-            # CPU % — primary left
-            ax1.plot(xs, cpu, color=ORANGE, linewidth=2, label="CPU %", zorder=3)
-            ax1.fill_between(xs, cpu, alpha=0.12, color=ORANGE)
-
-            # Thread count — also left axis
-            ax1.plot(xs, thrd, color="#fbbf24", linewidth=1.5,
-                     label="Threads", linestyle=":", zorder=2)
-
-            # RSS MB — secondary right axis
-            ax2.plot(xs, mem, color=accent_color, linewidth=2,
-                     label="RSS MB", linestyle="--", zorder=2)
-            ax2.fill_between(xs, mem, alpha=0.08, color=accent_color)
-            ax2.set_ylabel("RSS MB", color=TEXT_MUTED, fontsize=8)
-            ax2.tick_params(colors=TEXT_MUTED, labelsize=7)
-            for sp in ax2.spines.values():
-                sp.set_color(BORDER)
-
-            # X-axis: show real clock times, spaced sensibly
-            n    = len(xs)
-            step = max(1, n // 6)
-            ticks = list(range(0, n, step))
-            ax1.set_xticks([xs[i] for i in ticks])
-            ax1.set_xticklabels([x_labels[i] for i in ticks],
-                                 rotation=20, ha="right", fontsize=7)
-
-            ax1.set_ylabel("CPU % / Threads", color=TEXT_MUTED, fontsize=8)
-            ax1.tick_params(colors=TEXT_MUTED, labelsize=7)
-
-            # Combined legend
-            l1, lb1 = ax1.get_legend_handles_labels()
-            l2, lb2 = ax2.get_legend_handles_labels()
-            ax1.legend(l1 + l2, lb1 + lb2,
-                       facecolor=BG_CARD, edgecolor=BORDER,
-                       labelcolor=TEXT_SECONDARY, fontsize=8, loc="upper left")
-
-            for sp in ax1.spines.values():
-                sp.set_color(BORDER)
-            ax1.grid(True, color="#1e1e2a", linewidth=0.5, alpha=0.5)
-            fig.tight_layout(pad=1.5)
-            fig.subplots_adjust(bottom=0.25)
-
-            canvas = FigureCanvasTkAgg(fig, master=parent)
-            canvas.get_tk_widget().pack(fill="x", padx=12, pady=(4, 16))
-            canvas.draw()
+        if error is None:
+            try:
+                self._chart_fig = fig
+                canvas = FigureCanvasTkAgg(fig, master=parent)
+                canvas.get_tk_widget().pack(fill="x", padx=12, pady=(4, 16))
+                canvas.draw_idle()
+                return
+            except Exception as exc:
+                error = str(exc)
 
-        except Exception as exc:
-            ctk.CTkLabel(
-                parent, text=f"Chart rendering error: {exc}",
-                font=ctk.CTkFont(size=10), text_color=TEXT_MUTED,
-            ).pack(pady=10, padx=20)
+        ctk.CTkLabel(
+            parent, text=f"Chart rendering error: {error}",
+            font=get_font(10, family=None), text_color=TEXT_MUTED,
+        ).pack(pady=10, padx=20)
 
     # ────────────────────────────────────────────────────────────────
     #  Empty state
     # ────────────────────────────────────────────────────────────────
 
     def _render_empty(self):
+        self._cancel_builds()
         for w in self._scroll.winfo_children():
             w.destroy()
-        frame = ctk.CTkFrame(self._scroll, fg_color="transparent")
+        frame = transparent_frame(self._scroll)
         frame.pack(expand=True, pady=80)
         icon = get_icon("checkmark", size=48, color=GREEN)
-        self._icon_refs.append(icon)
         ctk.CTkLabel(frame, image=icon, text="").pack()
         ctk.CTkLabel(frame, text="No Active Crash Precursors",
-                     font=ctk.CTkFont(family=FONT_FAMILY, size=14, weight="bold"),
+                     font=get_font(14, "bold"),
                      text_color=GREEN).pack(pady=(12, 4))
         ctk.CTkLabel(frame, text="When the monitor detects a problem, details will appear here automatically.",
-                     font=ctk.CTkFont(family=FONT_FAMILY, size=12),
+                     font=get_font(12),
                      text_color=TEXT_MUTED).pack()
 
     # ────────────────────────────────────────────────────────────────
@@ -612,6 +719,5 @@ class CrashDetailsScreen(ctk.CTkFrame):
             self._destroyed = True
             if self._update_id:
                 self.after_cancel(self._update_id)
-            if self._chart_fig:
-                try: self._chart_fig.clf()
-                except Exception: pass
+            self._cancel_builds()
+            _release_figure(self._chart_fig)
@@ -9,23 +9,81 @@ Real-time statistics update every 3 seconds.
 
 import customtkinter as ctk
 import customtkinter as ctk
+from dataclasses import replace
 from datetime import datetime
 import requests
+import numpy as np
 import matplotlib
 matplotlib.use("Agg")
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 from desktop.theme import (
-    BG_ROOT, BG_CARD, BG_CARD_INNER, ORANGE, AMBER, GREEN, GREEN_BG, RED,
-    TEXT_PRIMARY, TEXT_SECONDARY, TEXT_MUTED, BORDER, FONT_FAMILY,
+    BG_ROOT, BG_CARD_INNER, ORANGE, AMBER, GREEN, GREEN_BG, RED,
+    TEXT_PRIMARY, TEXT_SECONDARY, TEXT_MUTED,
+    CHART_RC,
 )
 from desktop.data import DASHBOARD_METRICS, CRASH_TREND_DATA, CPU_DATA, MEMORY_DATA
 from desktop.icons import get_icon
+from desktop.fonts import get_font
+from desktop.widgets import card_frame, transparent_frame
 from desktop.system_metrics import get_all_metrics
+from desktop.screens.base import PollingScreen
 
 
-class DashboardScreen(ctk.CTkFrame):
+# ── Chart x positions ─────────────────────────────────────────────
+# The charts plot against 0..n-1 for a handful of distinct n; one read-only
+# float32 array per length is shared by every plot/fill_between call.
+_ARANGE_CACHE: dict[int, np.ndarray] = {}
+
+
+def _arange(n: int) -> np.ndarray:
+    """Cached, read-only ``np.arange(n, dtype=float32)``."""
+    x = _ARANGE_CACHE.get(n)
+    if x is None:
+        x = np.arange(n, dtype=np.float32)
+        x.flags.writeable = False
+        x = _ARANGE_CACHE.setdefault(n, x)
+    return x
+
+
+class _ChartBlitter:
+    """
+    Redraw a chart's data artists over a cached background (Matplotlib blitting).
+
+    The artists are marked animated, so a full draw renders only the static
+    parts (axes, ticks, grid); the `draw_event` handler snapshots that as the
+    background and paints the artists on top. `blit()` then restores the
+    snapshot and repaints just the artists inside the Axes box — used while
+    the axis limits and ticks are unchanged. Any full redraw (a resize, or a
+    `draw_idle()` after the axes change) refreshes the snapshot.
+    """
+
+    def __init__(self, canvas, ax, artists):
+        self._canvas = canvas
+        self._ax = ax
+        self._bg = None
+        self.artists = list(artists)
+        for a in self.artists:
+            a.set_animated(True)
+        canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _on_draw(self, event):
+        self._bg = self._canvas.copy_from_bbox(self._ax.bbox)
+        for a in self.artists:
+            self._ax.draw_artist(a)
+
+    def blit(self):
+        if self._bg is None:          # Not drawn yet — a full draw captures it
+            self._canvas.draw_idle()
+            return
+        self._canvas.restore_region(self._bg)
+        for a in self.artists:
+            self._ax.draw_artist(a)
+        self._canvas.blit(self._ax.bbox)
+
+
+class DashboardScreen(PollingScreen, ctk.CTkFrame):
     """
     Main dashboard view — uses a single internal CTkScrollableFrame.
     The outer CTkFrame ensures no nested scroll containers.
@@ -39,62 +97,61 @@ class DashboardScreen(ctk.CTkFrame):
         scroll.pack(fill="both", expand=True)
 
         # Bind mouse wheel for smooth scrolling (guarded against destroyed-canvas errors)
-        def _scroll_up(e):
-            try: scroll._parent_canvas.yview_scroll(-3, "units")
-            except Exception: pass
-        def _scroll_down(e):
-            try: scroll._parent_canvas.yview_scroll(3, "units")
-            except Exception: pass
-        scroll.bind_all("<Button-4>", _scroll_up)
-        scroll.bind_all("<Button-5>", _scroll_down)
+        self._scroll = scroll
+        self._bind_wheel()
 
         # ── System Status Banner ────────────────────────────────
-        status = ctk.CTkFrame(scroll, fg_color=GREEN_BG, corner_radius=16, border_width=1, border_color="#1a4a2a")
+        status = card_frame(scroll, fg_color=GREEN_BG, border_color="#1a4a2a")
         status.pack(fill="x", padx=24, pady=(20, 0))
-        status_inner = ctk.CTkFrame(status, fg_color="transparent")
+        status_inner = transparent_frame(status)
         status_inner.pack(fill="x", padx=20, pady=16)
 
-        left = ctk.CTkFrame(status_inner, fg_color="transparent")
+        left = transparent_frame(status_inner)
         left.pack(side="left")
 
         shield = ctk.CTkFrame(left, width=32, height=32, corner_radius=8, fg_color=GREEN)
         shield.pack(side="left", padx=(0, 10))
         shield.pack_propagate(False)
-        ctk.CTkLabel(shield, text="OK", font=ctk.CTkFont(family=FONT_FAMILY, size=10, weight="bold"), text_color="#ffffff").pack(expand=True)
+        ctk.CTkLabel(shield, text="OK", font=get_font(10, "bold"), text_color="#ffffff").pack(expand=True)
 
-        txt = ctk.CTkFrame(left, fg_color="transparent")
+        txt = transparent_frame(left)
         txt.pack(side="left")
-        ctk.CTkLabel(txt, text="System Status: Stable", font=ctk.CTkFont(family=FONT_FAMILY, size=14, weight="bold"), text_color=GREEN).pack(anchor="w")
-        ctk.CTkLabel(txt, text="All systems operational. No critical issues detected.", font=ctk.CTkFont(family=FONT_FAMILY, size=11), text_color="#4ade80").pack(anchor="w")
+        ctk.CTkLabel(txt, text="System Status: Stable", font=get_font(14, "bold"), text_color=GREEN).pack(anchor="w")
+        ctk.CTkLabel(txt, text="All systems operational. No critical issues detected.", font=get_font(11), text_color="#4ade80").pack(anchor="w")
 
-        right = ctk.CTkFrame(status_inner, fg_color="transparent")
+        right = transparent_frame(status_inner)
         right.pack(side="right")
         # Pulsing green dot
-        ctk.CTkLabel(right, text="\u25CF", font=ctk.CTkFont(size=10, weight="bold"), text_color=GREEN).pack(side="left", padx=(0, 4))
-        ctk.CTkLabel(right, text="Live", font=ctk.CTkFont(family=FONT_FAMILY, size=12, weight="bold"), text_color=GREEN).pack(side="left", padx=(0, 8))
-        self._live_time_label = ctk.CTkLabel(right, text="", font=ctk.CTkFont(family=FONT_FAMILY, size=11), text_color="#4ade80")
+        ctk.CTkLabel(right, text="\u25CF", font=get_font(10, "bold", family=None), text_color=GREEN).pack(side="left", padx=(0, 4))
+        ctk.CTkLabel(right, text="Live", font=get_font(12, "bold"), text_color=GREEN).pack(side="left", padx=(0, 8))
+        self._live_time_label = ctk.CTkLabel(right, text="", font=get_font(11), text_color="#4ade80")
         self._live_time_label.pack(side="left")
 
         # ── KPI Metric Cards ────────────────────────────────────
-        cards_frame = ctk.CTkFrame(scroll, fg_color="transparent")
+        cards_frame = transparent_frame(scroll)
         cards_frame.pack(fill="x", padx=24, pady=(16, 0))
         for i in range(4):
             cards_frame.columnconfigure(i, weight=1, uniform="mc")
 
         card_icon_names = ["crash_count", "recovery_time", "anomaly_score", "active_alerts"]
-        self._metric_icons = []  # Keep references to prevent GC
         self._metric_value_labels = []
         self._metric_sub_labels = []
-        keys = list(DASHBOARD_METRICS.keys())
-        for col, (key, icon_name) in enumerate(zip(keys, card_icon_names)):
-            m = DASHBOARD_METRICS[key]
-            self._make_metric_card(cards_frame, col, icon_name, m)
+        # Each card keeps its own copy of its KpiMetric record next to its
+        # labels, so the poll loop in _update_metrics writes through direct
+        # references and never looks a metric up by name. The copy keeps
+        # those writes out of the cached DASHBOARD_METRICS, which a later
+        # session's dashboard starts from.
+        for col, (m, icon_name) in enumerate(zip(DASHBOARD_METRICS.values(), card_icon_names)):
+            self._make_metric_card(cards_frame, col, icon_name, replace(m))
+
+        # Every Figure built below, released in _on_destroy
+        self._figs: list[Figure] = []
 
         # ── Crash Trend Chart ───────────────────────────────────
         self._make_chart_section(scroll, "Crash Trend - Last 24 Hours", CRASH_TREND_DATA, "crashes", ORANGE, "Crashes", True)
 
         # ── Resource Usage Charts ───────────────────────────────
-        charts_frame = ctk.CTkFrame(scroll, fg_color="transparent")
+        charts_frame = transparent_frame(scroll)
         charts_frame.pack(fill="x", padx=24, pady=(16, 24))
         charts_frame.columnconfigure(0, weight=1)
         charts_frame.columnconfigure(1, weight=1)
@@ -109,106 +166,109 @@ class DashboardScreen(ctk.CTkFrame):
         self.bind("<Destroy>", self._on_destroy)
 
     def _make_metric_card(self, parent, col, icon_name, m):
-        card = ctk.CTkFrame(parent, fg_color=BG_CARD, corner_radius=16, border_width=1, border_color=BORDER)
+        card = card_frame(parent)
         card.grid(row=0, column=col, padx=6, sticky="nsew")
 
-        inner = ctk.CTkFrame(card, fg_color="transparent")
-        inner.pack(fill="x", padx=16, pady=16)
-
-        top = ctk.CTkFrame(inner, fg_color="transparent")
-        top.pack(fill="x")
+        # Children are gridded straight onto the card: icon and trend badge
+        # share row 0, the text rows span both columns beneath them.
+        card.grid_columnconfigure(1, weight=1)
 
-        # Icon as CTkImage
+        # The icon label paints its own rounded tile, so no wrapper frame
         icon_img = get_icon(icon_name, size=22, color=ORANGE)
-        self._metric_icons.append(icon_img)
-        icon_frame = ctk.CTkFrame(top, width=44, height=44, corner_radius=12, fg_color="#2a1a08")
-        icon_frame.pack(side="left")
-        icon_frame.pack_propagate(False)
-        ctk.CTkLabel(icon_frame, image=icon_img, text="").pack(expand=True)
-
-        trend_color = RED if m["trend_up"] else GREEN
-        trend_bg = "#2a0f0f" if m["trend_up"] else "#0a2a14"
-        ctk.CTkLabel(top, text=m["trend"], font=ctk.CTkFont(family=FONT_FAMILY, size=11, weight="bold"), text_color=trend_color, fg_color=trend_bg, corner_radius=8, width=50, height=26).pack(side="right")
-
-        val_lbl = ctk.CTkLabel(inner, text=m["value"], font=ctk.CTkFont(family=FONT_FAMILY, size=28, weight="bold"), text_color=TEXT_PRIMARY, anchor="w")
-        val_lbl.pack(fill="x", pady=(10, 0))
-        ctk.CTkLabel(inner, text=m["label"], font=ctk.CTkFont(family=FONT_FAMILY, size=12), text_color=TEXT_SECONDARY, anchor="w").pack(fill="x")
-        sub_lbl = ctk.CTkLabel(inner, text=m["sub"], font=ctk.CTkFont(family=FONT_FAMILY, size=10), text_color=TEXT_MUTED, anchor="w")
-        sub_lbl.pack(fill="x")
+        ctk.CTkLabel(card, image=icon_img, text="", width=44, height=44, corner_radius=12, fg_color="#2a1a08").grid(
+            row=0, column=0, sticky="w", padx=(16, 0), pady=(16, 0))
+
+        trend_color = RED if m.trend_up else GREEN
+        trend_bg = "#2a0f0f" if m.trend_up else "#0a2a14"
+        ctk.CTkLabel(card, text=m.trend, font=get_font(11, "bold"), text_color=trend_color, fg_color=trend_bg, corner_radius=8, width=50, height=26).grid(
+            row=0, column=1, sticky="e", padx=(0, 16), pady=(16, 0))
+
+        val_lbl = ctk.CTkLabel(card, text=m.value, font=get_font(28, "bold"), text_color=TEXT_PRIMARY, anchor="w")
+        val_lbl.grid(row=1, column=0, columnspan=2, sticky="ew", padx=16, pady=(10, 0))
+        ctk.CTkLabel(card, text=m.label, font=get_font(12), text_color=TEXT_SECONDARY, anchor="w").grid(
+            row=2, column=0, columnspan=2, sticky="ew", padx=16)
+        sub_lbl = ctk.CTkLabel(card, text=m.sub, font=get_font(10), text_color=TEXT_MUTED, anchor="w")
+        sub_lbl.grid(row=3, column=0, columnspan=2, sticky="ew", padx=16, pady=(0, 16))
 
         # Store references for real-time update
         if not hasattr(self, '_metric_value_labels'):
             self._metric_value_labels = []
             self._metric_sub_labels = []
         self._metric_value_labels.append((val_lbl, m))
-        self._metric_sub_labels.append(sub_lbl)
+        self._metric_sub_labels.append((sub_lbl, m))
 
     def _make_chart_section(self, parent, title, data, key, color, ylabel, show_dots):
-        card = ctk.CTkFrame(parent, fg_color=BG_CARD, corner_radius=16, border_width=1, border_color=BORDER)
+        card = card_frame(parent)
         card.pack(fill="x", padx=24, pady=(16, 0))
 
-        header = ctk.CTkFrame(card, fg_color="transparent")
+        header = transparent_frame(card)
         header.pack(fill="x", padx=20, pady=(16, 0))
-        ctk.CTkLabel(header, text=title, font=ctk.CTkFont(family=FONT_FAMILY, size=14, weight="bold"), text_color=TEXT_PRIMARY).pack(side="left")
+        ctk.CTkLabel(header, text=title, font=get_font(14, "bold"), text_color=TEXT_PRIMARY).pack(side="left")
 
-        rt = ctk.CTkFrame(header, fg_color="transparent")
+        rt = transparent_frame(header)
         rt.pack(side="right")
-        ctk.CTkLabel(rt, text="*", font=ctk.CTkFont(size=10, weight="bold"), text_color=ORANGE).pack(side="left", padx=(0, 4))
-        ctk.CTkLabel(rt, text="Real-time data", font=ctk.CTkFont(family=FONT_FAMILY, size=10), text_color=TEXT_MUTED).pack(side="left")
+        ctk.CTkLabel(rt, text="*", font=get_font(10, "bold", family=None), text_color=ORANGE).pack(side="left", padx=(0, 4))
+        ctk.CTkLabel(rt, text="Real-time data", font=get_font(10), text_color=TEXT_MUTED).pack(side="left")
 
-        fig = Figure(figsize=(8, 2.5), dpi=100)
-        fig.patch.set_facecolor(BG_CARD)
-        ax = fig.add_subplot(111)
-        ax.set_facecolor(BG_CARD)
+        # Dark card palette, scoped to this chart (see theme.CHART_RC)
+        with matplotlib.rc_context(CHART_RC):
+            fig = Figure(figsize=(8, 2.5), dpi=100)
+            self._figs.append(fig)
+            ax = fig.add_subplot(111)
 
-        times = [d["time"] for d in data]
-        vals = [d[key] for d in data]
+            times = data["time"]
+            vals = data[key]
 
-        ax.plot(times, vals, color=color, linewidth=2, marker="o" if show_dots else None, markersize=5, markerfacecolor=color)
-        ax.fill_between(range(len(vals)), vals, alpha=0.1, color=color)
+            x = _arange(len(vals))
+            ax.plot(x, vals, color=color, linewidth=2, marker="o" if show_dots else None, markersize=5, markerfacecolor=color)
+            ax.fill_between(x, vals, alpha=0.1, color=color)
+            ax.set_xticks(x)
+            ax.set_xticklabels(times)   # same labels the categorical axis showed
 
-        ax.set_ylabel(ylabel, color=TEXT_MUTED, fontsize=9)
-        ax.tick_params(colors=TEXT_MUTED, labelsize=8)
-        for spine in ax.spines.values():
-            spine.set_color(BORDER)
-        ax.grid(True, color="#1e1e2a", linewidth=0.5, alpha=0.5)
-        fig.tight_layout(pad=1.5)
+            ax.set_ylabel(ylabel, fontsize=9)
+            ax.tick_params(labelsize=8)
+            ax.grid(True, color="#1e1e2a", linewidth=0.5, alpha=0.5)
+            fig.tight_layout(pad=1.5)
 
         canvas = FigureCanvasTkAgg(fig, master=card)
         canvas.get_tk_widget().pack(fill="x", padx=12, pady=(4, 12))
-        canvas.draw()
+        canvas.draw_idle()
 
         if not hasattr(self, '_trend_chart'):
             self._trend_chart = (fig, ax, canvas, color)
+            self._trend_live = None   # [line, fill] once live data arrives
 
     def _make_resource_chart(self, parent, col, title, data, color, current_val):
-        card = ctk.CTkFrame(parent, fg_color=BG_CARD, corner_radius=16, border_width=1, border_color=BORDER)
+        card = card_frame(parent)
         card.grid(row=0, column=col, padx=6, sticky="nsew")
 
-        ctk.CTkLabel(card, text=title, font=ctk.CTkFont(family=FONT_FAMILY, size=14, weight="bold"), text_color=TEXT_PRIMARY).pack(anchor="w", padx=20, pady=(16, 0))
+        ctk.CTkLabel(card, text=title, font=get_font(14, "bold"), text_color=TEXT_PRIMARY).pack(anchor="w", padx=20, pady=(16, 0))
 
-        fig = Figure(figsize=(4, 2), dpi=100)
-        fig.patch.set_facecolor(BG_CARD)
-        ax = fig.add_subplot(111)
-        ax.set_facecolor(BG_CARD)
+        with matplotlib.rc_context(CHART_RC):
+            fig = Figure(figsize=(4, 2), dpi=100)
+            self._figs.append(fig)
+            ax = fig.add_subplot(111)
 
-        # Initial empty plot
-        ax.set_ylim(0, 100)
-        ax.tick_params(colors=TEXT_MUTED, labelsize=7)
-        for spine in ax.spines.values():
-            spine.set_color(BORDER)
-        ax.grid(True, color="#1e1e2a", linewidth=0.5, alpha=0.5)
-        ax.set_ylabel("%", color=TEXT_MUTED, fontsize=8)
-        fig.tight_layout(pad=1.2)
+            # Initial empty plot
+            ax.set_ylim(0, 100)
+            ax.tick_params(labelsize=7)
+            ax.grid(True, color="#1e1e2a", linewidth=0.5, alpha=0.5)
+            ax.set_ylabel("%", fontsize=8)
+            # Persistent series line: live updates move it with set_data()
+            # instead of clearing and restyling the Axes every tick.
+            line, = ax.plot([], [], color=color, linewidth=2, marker="o",
+                            markersize=3, markerfacecolor=color)
+            fig.tight_layout(pad=1.2)
 
         canvas = FigureCanvasTkAgg(fig, master=card)
         canvas.get_tk_widget().pack(fill="x", padx=12, pady=(4, 4))
-        canvas.draw()
+        blitter = _ChartBlitter(canvas, ax, [line])
+        canvas.draw_idle()
 
-        btm = ctk.CTkFrame(card, fg_color="transparent")
+        btm = transparent_frame(card)
         btm.pack(fill="x", padx=20, pady=(0, 12))
-        ctk.CTkLabel(btm, text="Current: ", font=ctk.CTkFont(family=FONT_FAMILY, size=11), text_color=TEXT_MUTED).pack(side="left")
-        rv_lbl = ctk.CTkLabel(btm, text=current_val, font=ctk.CTkFont(family=FONT_FAMILY, size=12, weight="bold"), text_color=color)
+        ctk.CTkLabel(btm, text="Current: ", font=get_font(11), text_color=TEXT_MUTED).pack(side="left")
+        rv_lbl = ctk.CTkLabel(btm, text=current_val, font=get_font(12, "bold"), text_color=color)
         rv_lbl.pack(side="left")
 
         if not hasattr(self, '_resource_val_labels'):
@@ -219,8 +279,10 @@ class DashboardScreen(ctk.CTkFrame):
         if not hasattr(self, '_chart_components'):
             self._chart_components = []
             self._chart_data = []
-        self._chart_components.append((fig, ax, canvas, color))
+            self._chart_fills = []
+        self._chart_components.append((fig, ax, canvas, color, line, blitter))
         self._chart_data.append([])  # rolling data buffer
+        self._chart_fills.append(None)  # current fill_between collection
 
     # ── Real-time update logic ──────────────────────────────────
 
@@ -241,8 +303,10 @@ class DashboardScreen(ctk.CTkFrame):
                 f"{metrics['cpu_percent']:.1f}%",
                 str(metrics["thread_count"]),
             ]
-            for i, (lbl, m) in enumerate(self._metric_value_labels):
-                lbl.configure(text=real_values[i])
+            for (lbl, m), text in zip(self._metric_value_labels, real_values):
+                if m.value != text:
+                    m.value = text
+                    lbl.configure(text=text)
 
             # Update sub-text with live info
             sub_texts = [
@@ -251,8 +315,9 @@ class DashboardScreen(ctk.CTkFrame):
                 f"All cores · {now}",
                 f"All processes · {now}",
             ]
-            for i, lbl in enumerate(self._metric_sub_labels):
-                lbl.configure(text=sub_texts[i])
+            for (lbl, m), text in zip(self._metric_sub_labels, sub_texts):
+                m.sub = text
+                lbl.configure(text=text)
 
             # Update Crash Trend Chart with live data
             try:
@@ -261,24 +326,35 @@ class DashboardScreen(ctk.CTkFrame):
                     trend_data = resp.json()
                     if trend_data and hasattr(self, '_trend_chart'):
                         fig, ax, canvas, color = self._trend_chart
-                        ax.clear()
-                        ax.set_facecolor(BG_CARD)
-                        
+
                         # Plot the number of active alerts representing "Crashes"
                         vals = [d.get("alerts", 0) for d in trend_data[-30:]]  # last 30 data points
-                        x = list(range(len(vals)))
-                        
-                        ax.plot(x, vals, color=color, linewidth=2, marker="o" if len(vals) < 20 else None, markersize=5, markerfacecolor=color)
-                        ax.fill_between(x, vals, alpha=0.1, color=color)
-                        
-                        ax.set_ylabel("Active Alerts", color=TEXT_MUTED, fontsize=9)
-                        ax.tick_params(colors=TEXT_MUTED, labelsize=8)
-                        ax.set_xticks([])  # Hide x-axis ticks
-                        
-                        for spine in ax.spines.values():
-                            spine.set_color(BORDER)
-                        ax.grid(True, color="#1e1e2a", linewidth=0.5, alpha=0.5)
-                        fig.tight_layout(pad=1.5)
+                        x = _arange(len(vals))
+
+                        if self._trend_live is None:
+                            # First live sample: replace the demo series (categorical
+                            # time axis) with a numeric one, once. Later refreshes only
+                            # move these artists.
+                            # clear() re-reads rcParams, so restyle under the chart palette
+                            with matplotlib.rc_context(CHART_RC):
+                                ax.clear()
+                                line, = ax.plot([], [], color=color, linewidth=2, markersize=5, markerfacecolor=color)
+                                ax.set_ylabel("Active Alerts", fontsize=9)
+                                ax.tick_params(labelsize=8)
+                                ax.set_xticks([])  # Hide x-axis ticks
+                                ax.grid(True, color="#1e1e2a", linewidth=0.5, alpha=0.5)
+                                fig.tight_layout(pad=1.5)
+                            self._trend_live = [line, None]
+
+                        line, fill = self._trend_live
+                        line.set_data(x, vals)
+                        line.set_marker("o" if len(vals) < 20 else "None")
+                        # fill_between has no set_data(); swap the one collection.
+                        if fill is not None:
+                            fill.remove()
+                        self._trend_live[1] = ax.fill_between(x, vals, alpha=0.1, color=color)
+                        ax.relim()
+                        ax.autoscale_view()
                         canvas.draw_idle()
             except Exception as e:
                 pass  # Ignore network errors on dashboard refresh
@@ -303,32 +379,37 @@ class DashboardScreen(ctk.CTkFrame):
                         buf[:] = buf[-max_points:]
 
                     if i < len(self._chart_components):
-                        fig, ax, canvas, color = self._chart_components[i]
-                        ax.clear()
-                        ax.set_facecolor(BG_CARD)
-                        ax.set_ylim(0, 100)
+                        fig, ax, canvas, color, line, blitter = self._chart_components[i]
 
-                        x = list(range(len(buf)))
-                        ax.fill_between(x, buf, alpha=0.15, color=color)
-                        ax.plot(x, buf, color=color, linewidth=2, marker="o",
-                                markersize=3, markerfacecolor=color)
+                        n = len(buf)
+                        grew = n != len(line.get_xdata())
+                        x = _arange(n)
+                        line.set_data(x, buf)
+                        # fill_between has no set_data(); swap the one collection.
+                        if self._chart_fills[i] is not None:
+                            self._chart_fills[i].remove()
+                        fill = ax.fill_between(x, buf, alpha=0.15, color=color, animated=True)
+                        self._chart_fills[i] = fill
+                        blitter.artists = [fill, line]
+
+                        if not grew:
+                            # Full buffer: x range and tick labels are unchanged,
+                            # so only the data artists need repainting.
+                            blitter.blit()
+                            continue
+
+                        ax.relim()
+                        ax.autoscale_view(scaley=False)   # y stays fixed at 0–100
 
                         # X-axis: show seconds ago
-                        n = len(buf)
                         labels = [f"-{(n - 1 - j) * 3}s" for j in range(n)]
                         ax.set_xticks(x)
-                        ax.set_xticklabels(labels, fontsize=6, rotation=0)
+                        ax.set_xticklabels(labels)   # size from tick_params(labelsize=7)
                         # Only show every 4th label to avoid crowding
                         for j, label in enumerate(ax.xaxis.get_ticklabels()):
                             if j % 4 != 0 and j != n - 1:
                                 label.set_visible(False)
 
-                        ax.tick_params(colors=TEXT_MUTED, labelsize=7)
-                        for spine in ax.spines.values():
-                            spine.set_color(BORDER)
-                        ax.grid(True, color="#1e1e2a", linewidth=0.5, alpha=0.5)
-                        ax.set_ylabel("%", color=TEXT_MUTED, fontsize=8)
-                        fig.tight_layout(pad=1.2)
                         canvas.draw_idle()
 
             # Schedule next update (3 seconds)
@@ -336,9 +417,23 @@ class DashboardScreen(ctk.CTkFrame):
         except Exception:
             pass  # Widget destroyed
 
+    # ── Visibility hooks (called by CrashSenseApp, which caches screens) ──
+
+    def _refresh_now(self):
+        """Update the metrics now; `_update_metrics` re-arms `_update_id`."""
+        self._update_metrics()
+
     def _on_destroy(self, event):
-        """Cancel pending updates when widget is destroyed."""
-        if event.widget is self and self._update_id is not None:
+        """Cancel pending updates and release the chart Figures when destroyed."""
+        if event.widget is not self:
+            return
+        if self._update_id is not None:
             self.after_cancel(self._update_id)
             self._update_id = None
+        # The canvases go with the widget tree, but the Figures and their
+        # artists would otherwise live on through the references held in
+        # _trend_chart / _chart_components.
+        for fig in self._figs:
+            fig.clf()
+        self._figs.clear()
 
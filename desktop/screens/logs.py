@@ -23,6 +23,7 @@ from desktop.theme import (
     RED, RED_BG, YELLOW, YELLOW_BG, GREEN, GREEN_BG, BLUE, BLUE_BG,
     TEXT_PRIMARY, TEXT_SECONDARY, TEXT_MUTED, BORDER, FONT_FAMILY,
 )
+from desktop.screens.base import PollingScreen
 
 _API_BASE    = "http://127.0.0.1:5000"
 _REFRESH_MS  = 8000
@@ -36,7 +37,7 @@ LEVEL_COLORS = {
 }
 
 
-class LogsScreen(ctk.CTkFrame):
+class LogsScreen(PollingScreen, ctk.CTkFrame):
     """Live system logs viewer — same structure, real data."""
 
     def __init__(self, master, **kwargs):
@@ -66,9 +67,8 @@ class LogsScreen(ctk.CTkFrame):
             scrollbar_button_hover_color="#2a2c36",
         )
         scroll.pack(fill="both", expand=True)
-        scroll.bind_all("<Button-4>", lambda e: scroll._parent_canvas.yview_scroll(-3, "units"))
-        scroll.bind_all("<Button-5>", lambda e: scroll._parent_canvas.yview_scroll( 3, "units"))
         self._scroll = scroll
+        self._bind_wheel()
 
         # ── Search & Filters ──────────────────────────────────────
         search_card = ctk.CTkFrame(scroll, fg_color=BG_CARD, corner_radius=16,
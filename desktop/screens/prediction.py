@@ -23,6 +23,7 @@ from desktop.theme import (
     TEXT_PRIMARY, TEXT_SECONDARY, TEXT_MUTED, BORDER, FONT_FAMILY, BLUE,
 )
 from desktop.icons import get_icon
+from desktop.screens.base import CachedScreen
 
 _API_BASE = "http://127.0.0.1:5000"
 _REFRESH_MS = 5000
@@ -56,12 +57,16 @@ _TYPE_ICON_NAMES = {
     "oom_risk":          "oom_risk",
 }
 
-class PredictionScreen(ctk.CTkFrame):
+class PredictionScreen(CachedScreen, ctk.CTkFrame):
     def __init__(self, master, **kwargs):
         super().__init__(master, fg_color=BG_ROOT, **kwargs)
         self._update_id = None
         self._destroyed = False
         self._last_score = 100
+        # Bumped on hide/show; a refresh chain only reschedules itself while
+        # its generation is current, so hiding stops it and showing never
+        # leaves two chains running.
+        self._refresh_gen = 0
         
         self._build_ui()
         self.bind("<Destroy>", self._on_destroy)
@@ -75,16 +80,8 @@ class PredictionScreen(ctk.CTkFrame):
         )
         scroll.pack(fill="both", expand=True)
 
-        def _scroll_up(e):
-            try: scroll._parent_canvas.yview_scroll(-3, "units")
-            except Exception: pass
-        def _scroll_down(e):
-            try: scroll._parent_canvas.yview_scroll(3, "units")
-            except Exception: pass
-        scroll.bind_all("<Button-4>", _scroll_up)
-        scroll.bind_all("<Button-5>", _scroll_down)
-
         self._scroll = scroll
+        self._bind_wheel()
 
         # ─── Top Row: Gauge and Trend Chart ─────────────────────
         top_grid = ctk.CTkFrame(scroll, fg_color="transparent")
@@ -207,11 +204,11 @@ class PredictionScreen(ctk.CTkFrame):
         
         self.after(16, self._animate_gauge, target_score, current_score, steps, current_step + 1)
 
-    def _schedule_update(self):
-        if self._destroyed: return
-        threading.Thread(target=self._fetch_data, daemon=True).start()
+    def _schedule_update(self, gen=0):
+        if self._destroyed or gen != self._refresh_gen: return
+        threading.Thread(target=self._fetch_data, args=(gen,), daemon=True).start()
 
-    def _fetch_data(self):
+    def _fetch_data(self, gen=0):
         try:
             alerts  = requests.get(f"{_API_BASE}/api/process-alerts",       timeout=3).json()
             stats   = requests.get(f"{_API_BASE}/api/process-stats",         timeout=3).json()
@@ -226,8 +223,8 @@ class PredictionScreen(ctk.CTkFrame):
         except Exception: 
             pass
 
-        if not self._destroyed:
-            self.after(_REFRESH_MS, self._schedule_update)
+        if not self._destroyed and gen == self._refresh_gen:
+            self.after(_REFRESH_MS, self._schedule_update, gen)
 
     def _update_ui(self, alerts_data, stats_data, trend_data, ml_stat=None):
         summary = alerts_data.get("summary", {})
@@ -255,7 +252,7 @@ class PredictionScreen(ctk.CTkFrame):
             self._ax.set_ylim(0, 105)
             self._ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
             self._ax.grid(True, linestyle='--', alpha=0.1)
-        self._canvas_chart.draw()
+        self._canvas_chart.draw_idle()
 
         # Update Alerts
         self._alert_count_badge.configure(text=str(len(alerts_data.get("alerts", []))))
@@ -367,6 +364,17 @@ class PredictionScreen(ctk.CTkFrame):
                          text=f"Alert ({alert.get('type', '?')}) rendering error: {exc}",
                          font=ctk.CTkFont(size=11), text_color=TEXT_MUTED).pack(pady=10)
 
+    # ── Visibility hooks (called by CrashSenseApp, which caches screens) ──
+
+    def _pause(self):
+        """Stop the refresh chain while the screen is not displayed."""
+        self._refresh_gen += 1
+
+    def _resume(self):
+        """Start a fresh refresh chain."""
+        self._refresh_gen += 1
+        self._schedule_update(self._refresh_gen)
+
     def _on_destroy(self, event):
         if event.widget is self:
             self._destroyed = True
@@ -25,12 +25,13 @@ from desktop.theme import (
     TEXT_PRIMARY, TEXT_SECONDARY, TEXT_MUTED, BORDER, FONT_FAMILY,
     RED, GREEN,
 )
+from desktop.screens.base import CachedScreen
 from desktop import session
 
 BACKEND_BASE = "http://127.0.0.1:5000"
 
 
-class ProfileScreen(ctk.CTkFrame):
+class ProfileScreen(CachedScreen, ctk.CTkFrame):
     """User profile screen with display and inline edit mode."""
 
     def __init__(self, master, **kwargs):
@@ -44,6 +45,58 @@ class ProfileScreen(ctk.CTkFrame):
 
         self._build()
 
+    def _resume(self):
+        """Refresh the displayed profile from the session (skipped mid-edit)."""
+        user = session.get_user()
+        if self._edit_mode or user == self._user:
+            return
+        self._user = user
+
+        display_name = user.get("display_name") or user.get("email") or "Guest User"
+        self._avatar_lbl.configure(text=session.get_initials())   # Image follows from _load_avatar
+        self._load_avatar(display_name)
+        self._name_label.configure(text=display_name)
+        self._name_entry.delete(0, "end")
+        self._name_entry.insert(0, display_name)
+
+        values = {
+            "Email":        user.get("email", "—"),
+            "Role":         user.get("role", "User"),
+            "Member Since": user.get("joined", "—") or "—",
+        }
+        for label, value in values.items():
+            field = self._fields.get(label)
+            if not field:
+                continue
+            field["label"].configure(text=value)
+            entry = field.get("entry")
+            if entry:
+                entry.delete(0, "end")
+                entry.insert(0, value if value != "—" else "")
+
+    def _load_avatar(self, display_name: str):
+        """Fetch a generated avatar for `display_name` in the background."""
+        def _fetch_avatar():
+            try:
+                import urllib.parse
+                name_encoded = urllib.parse.quote(display_name)
+                # Ensure no spaces by using + for spaces or standard urlencode
+                url = f"https://ui-avatars.com/api/?name={name_encoded}&background=random&color=fff&size=200&bold=true&rounded=true"
+                resp = requests.get(url, timeout=3)
+                if resp.status_code == 200:
+                    from PIL import Image
+                    import io
+                    img_data = resp.content
+                    image = Image.open(io.BytesIO(img_data)).convert("RGBA")
+                    
+                    ctk_img = ctk.CTkImage(light_image=image, dark_image=image, size=(90, 90))
+                    self._avatar_img_ref = ctk_img  # prevent GC
+                    self.after(0, lambda: self._avatar_lbl.configure(image=ctk_img, text=""))
+            except Exception:
+                pass
+                
+        threading.Thread(target=_fetch_avatar, daemon=True).start()
+
     def _build(self):
         user = self._user
 
@@ -57,8 +110,8 @@ class ProfileScreen(ctk.CTkFrame):
             corner_radius=24, border_width=1, border_color=BORDER,
         )
         card.pack(pady=48)
-        card.bind_all("<Button-4>", lambda e: card._parent_canvas.yview_scroll(-3, "units"))
-        card.bind_all("<Button-5>", lambda e: card._parent_canvas.yview_scroll(3, "units"))
+        self._scroll = card
+        self._bind_wheel()
 
         inner = ctk.CTkFrame(card, fg_color="transparent")
         inner.pack(expand=True, fill="both", padx=48, pady=36)
@@ -78,26 +131,7 @@ class ProfileScreen(ctk.CTkFrame):
         )
         self._avatar_lbl.pack(expand=True)
         
-        def _fetch_avatar():
-            try:
-                import urllib.parse
-                name_encoded = urllib.parse.quote(display_name)
-                # Ensure no spaces by using + for spaces or standard urlencode
-                url = f"https://ui-avatars.com/api/?name={name_encoded}&background=random&color=fff&size=200&bold=true&rounded=true"
-                resp = requests.get(url, timeout=3)
-                if resp.status_code == 200:
-                    from PIL import Image
-                    import io
-                    img_data = resp.content
-                    image = Image.open(io.BytesIO(img_data)).convert("RGBA")
-                    
-                    ctk_img = ctk.CTkImage(light_image=image, dark_image=image, size=(90, 90))
-                    self._avatar_img_ref = ctk_img  # prevent GC
-                    self.after(0, lambda: self._avatar_lbl.configure(image=ctk_img, text=""))
-            except Exception:
-                pass
-                
-        threading.Thread(target=_fetch_avatar, daemon=True).start()
+        self._load_avatar(display_name)
 
         # Header row: name + edit button
         header = ctk.CTkFrame(inner, fg_color="transparent")
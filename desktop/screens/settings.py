@@ -15,12 +15,13 @@ from desktop.theme import (
     TEXT_PRIMARY, TEXT_SECONDARY, TEXT_MUTED, BORDER, FONT_FAMILY, GREEN
 )
 from desktop.icons import get_icon
+from desktop.screens.base import CachedScreen
 from desktop import session
 
 BACKEND_BASE = "http://127.0.0.1:5000"
 
 
-class SettingsScreen(ctk.CTkFrame):
+class SettingsScreen(CachedScreen, ctk.CTkFrame):
     """Settings panel — single scroll container."""
 
     def __init__(self, master, on_logout, **kwargs):
@@ -34,15 +35,18 @@ class SettingsScreen(ctk.CTkFrame):
 
         scroll = ctk.CTkScrollableFrame(self, fg_color=BG_ROOT, scrollbar_button_color="#1e2028", scrollbar_button_hover_color="#2a2c36")
         scroll.pack(fill="both", expand=True)
-        scroll.bind_all("<Button-4>", lambda e: scroll._parent_canvas.yview_scroll(-3, "units"))
-        scroll.bind_all("<Button-5>", lambda e: scroll._parent_canvas.yview_scroll(3, "units"))
 
-        self._section_icons = []  # prevent GC
         self._scroll = scroll
+        self._bind_wheel()
         
         # Load settings from backend before building UI
         self._load_settings()
 
+    def _resume(self):
+        """Reload the profile section, which may have been edited on the
+        Profile screen since this one was built."""
+        self._refresh_profile()
+
     def _load_settings(self):
         uid = self._user.get("uid")
         if uid:
@@ -96,7 +100,6 @@ class SettingsScreen(ctk.CTkFrame):
         li.pack(fill="x", padx=20, pady=16)
 
         sec_icon = get_icon("shield_lock", size=22, color=RED)
-        self._section_icons.append(sec_icon)
         icon = ctk.CTkFrame(li, width=48, height=48, corner_radius=12, fg_color="#3a1515")
         icon.pack(side="left")
         icon.pack_propagate(False)
@@ -122,7 +125,6 @@ class SettingsScreen(ctk.CTkFrame):
         header.pack(fill="x", padx=20, pady=(16, 12))
 
         sec_icon = get_icon(icon_name, size=22, color=ORANGE)
-        self._section_icons.append(sec_icon)
         icon = ctk.CTkFrame(header, width=48, height=48, corner_radius=12, fg_color="#2a1a08")
         icon.pack(side="left")
         icon.pack_propagate(False)
@@ -143,25 +145,37 @@ class SettingsScreen(ctk.CTkFrame):
         ri = ctk.CTkFrame(row, fg_color="transparent")
         ri.pack(fill="x", padx=14, pady=10)
 
-        # Basic placeholder based on local session email until fetch
-        raw_email = self._user.get("email", "User")
-        initials = raw_email[0].upper() if raw_email else "U"
-        
         av = ctk.CTkFrame(ri, width=38, height=38, corner_radius=19, fg_color=ORANGE)
         av.pack(side="left")
         av.pack_propagate(False)
-        ctk.CTkLabel(av, text=initials, font=ctk.CTkFont(family=FONT_FAMILY, size=14, weight="bold"), text_color="#ffffff").pack(expand=True)
+        self._profile_initials = ctk.CTkLabel(av, text="", font=ctk.CTkFont(family=FONT_FAMILY, size=14, weight="bold"), text_color="#ffffff")
+        self._profile_initials.pack(expand=True)
 
         txt = ctk.CTkFrame(ri, fg_color="transparent")
         txt.pack(side="left", padx=(10, 0))
         
-        name_lbl = ctk.CTkLabel(txt, text="Loading Firebase Profile...", font=ctk.CTkFont(family=FONT_FAMILY, size=13, weight="bold"), text_color=TEXT_PRIMARY)
-        name_lbl.pack(anchor="w")
-        email_lbl = ctk.CTkLabel(txt, text=raw_email, font=ctk.CTkFont(family=FONT_FAMILY, size=11), text_color=TEXT_SECONDARY)
-        email_lbl.pack(anchor="w")
+        self._profile_name = ctk.CTkLabel(txt, text="", font=ctk.CTkFont(family=FONT_FAMILY, size=13, weight="bold"), text_color=TEXT_PRIMARY)
+        self._profile_name.pack(anchor="w")
+        self._profile_email = ctk.CTkLabel(txt, text="", font=ctk.CTkFont(family=FONT_FAMILY, size=11), text_color=TEXT_SECONDARY)
+        self._profile_email.pack(anchor="w")
+
+        self._profile_role = ctk.CTkLabel(ri, text="", font=ctk.CTkFont(family=FONT_FAMILY, size=10, weight="bold"), text_color=ORANGE, fg_color="#2a1a08", corner_radius=10)
+        self._profile_role.pack(side="right")
+
+        self._refresh_profile()
+
+    def _refresh_profile(self):
+        """Show the session user in the profile section, then fetch the stored profile."""
+        self._user = session.get_user()
+
+        # Basic placeholder based on local session email until fetch
+        raw_email = self._user.get("email", "User")
+        self._profile_initials.configure(text=raw_email[0].upper() if raw_email else "U")
+        self._profile_name.configure(text=self._user.get("display_name") or "Loading Firebase Profile...")
+        self._profile_email.configure(text=raw_email)
+        self._profile_role.configure(text=" Fetching... ")
 
-        role_lbl = ctk.CTkLabel(ri, text=" Fetching... ", font=ctk.CTkFont(family=FONT_FAMILY, size=10, weight="bold"), text_color=ORANGE, fg_color="#2a1a08", corner_radius=10)
-        role_lbl.pack(side="right")
+        name_lbl, role_lbl = self._profile_name, self._profile_role
 
         def _fetch_profile():
             uid = self._user.get("uid")
@@ -76,3 +76,25 @@ NAV_ITEMS = [
     {"id": "profile",       "label": "My Profile",    "icon": "\u25CF"},
     {"id": "settings",      "label": "Settings",      "icon": "\u2699"},
 ]
+
+# ─── Severity / Log-Level Ranking ──────────────────────────────
+# Sort keys (0 = most severe). Alert severities arrive lower-case from the
+# backend; log levels are upper-case. Unknown values rank after all known.
+SEVERITY_RANK = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+LEVEL_RANK = {"ERROR": 0, "WARN": 1, "INFO": 2, "DEBUG": 3}
+
+# ─── Chart Style (Matplotlib rcParams) ─────────────────────────
+# The dashboard and crash-details charts are built inside
+# matplotlib.rc_context(CHART_RC), so their Figures and Axes start out in the
+# dark card palette instead of being recoloured artist by artist. Ticks added
+# later by live updates copy their style from the first tick, so they keep it
+# outside the context. Global rcParams are left alone, so other screens'
+# charts (Prediction) are unaffected.
+CHART_RC = {
+    "figure.facecolor": BG_CARD,
+    "axes.facecolor":   BG_CARD,
+    "axes.edgecolor":   BORDER,
+    "axes.labelcolor":  TEXT_MUTED,
+    "xtick.color":      TEXT_MUTED,
+    "ytick.color":      TEXT_MUTED,
+}
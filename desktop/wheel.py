@@ -0,0 +1,69 @@
+"""
+CrashSense — Mouse-Wheel Scrolling
+===================================
+
+Routes X11 wheel events (``<Button-4>`` / ``<Button-5>``) to a
+``CTkScrollableFrame`` and coalesces bursts into one scroll per idle cycle.
+
+A fast wheel delivers many events back to back; scrolling on each one
+redraws the scroll canvas once per event. Here each event only adds to a
+pending step count, and the first event of a burst schedules an
+``after_idle`` flush that scrolls by the total — the queued events are all
+handled before Tk goes idle, so a burst costs one redraw.
+
+Usage::
+
+    from desktop.wheel import bind_wheel
+    bind_wheel(self, self._scroll)     # e.g. from a screen's on_show()
+
+The bindings use ``bind_all`` and *replace* the previous wheel handler, so
+the most recently shown screen owns the wheel. (Appending with ``"+"``
+would stack every screen's handler and scroll hidden screens too.)
+"""
+
+import customtkinter as ctk
+
+
+class _WheelCoalescer:
+    """Accumulates wheel steps for one scroll frame and flushes them when idle."""
+
+    __slots__ = ("_widget", "_canvas", "_step", "_pending", "_scheduled")
+
+    def __init__(self, widget, scroll_frame: ctk.CTkScrollableFrame, step: int):
+        self._widget = widget
+        self._canvas = scroll_frame._parent_canvas
+        self._step = step
+        self._pending = 0
+        self._scheduled = False
+
+    def up(self, _event=None):
+        self._add(-self._step)
+
+    def down(self, _event=None):
+        self._add(self._step)
+
+    def _add(self, units: int):
+        self._pending += units
+        if not self._scheduled:
+            self._scheduled = True
+            self._widget.after_idle(self._flush)
+
+    def _flush(self):
+        units, self._pending, self._scheduled = self._pending, 0, False
+        if units:
+            try: self._canvas.yview_scroll(units, "units")
+            except Exception: pass
+
+
+def bind_wheel(widget, scroll_frame: ctk.CTkScrollableFrame, step: int = 3):
+    """
+    Route wheel scrolling application-wide to `scroll_frame`.
+
+    Args:
+        widget:       Widget that owns the binding (and the idle callback).
+        scroll_frame: The scrollable frame to move.
+        step:         Units scrolled per wheel notch.
+    """
+    wheel = _WheelCoalescer(widget, scroll_frame, step)
+    widget.bind_all("<Button-4>", wheel.up)
+    widget.bind_all("<Button-5>", wheel.down)
@@ -5,6 +5,23 @@ Reusable CustomTkinter widgets for the monitoring dashboard.
 
 import customtkinter as ctk
 
+from desktop.theme import BG_CARD, BORDER
+
+
+# ── Frame factories ───────────────────────────────────────────────
+# Cards share one style dict; layout-only groups are bare transparent frames.
+_CARD_STYLE = {"fg_color": BG_CARD, "corner_radius": 16, "border_width": 1, "border_color": BORDER}
+
+
+def card_frame(parent, **opts) -> ctk.CTkFrame:
+    """A bordered card frame; `opts` override the shared card style."""
+    return ctk.CTkFrame(parent, **{**_CARD_STYLE, **opts})
+
+
+def transparent_frame(parent) -> ctk.CTkFrame:
+    """A transparent frame used purely for layout grouping."""
+    return ctk.CTkFrame(parent, fg_color="transparent")
+
 
 class MetricCard(ctk.CTkFrame):
     """